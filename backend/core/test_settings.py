@@ -0,0 +1,24 @@
+"""
+Settings for running the test suite.
+
+Extends the project settings with overrides that only make sense under test.
+"""
+
+from .settings import *  # noqa: F401,F403
+
+# Tests create users constantly; a fast hasher keeps create_user() cheap
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+# Keep uploads off the disk. STORAGES replaces the legacy setting, so the
+# static files backend moves across unchanged.
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.InMemoryStorage',
+    },
+    'staticfiles': {
+        'BACKEND': STATICFILES_STORAGE,  # noqa: F405
+    },
+}
+del STATICFILES_STORAGE
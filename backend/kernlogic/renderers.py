@@ -0,0 +1,35 @@
+import orjson
+from django.utils.http import parse_header_parameters
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    Drop-in replacement for DRF's JSONRenderer backed by orjson.
+    Types orjson can't handle natively fall back to DRF's JSONEncoder so the
+    output matches the stock renderer (decimals, lazy strings, datetimes).
+    """
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    options = (
+        orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_NON_STR_KEYS
+    )
+
+    default = JSONEncoder().default
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        options = self.options
+        # Honour the ``indent`` media type parameter like JSONRenderer does;
+        # orjson only supports two-space indentation
+        if accepted_media_type:
+            base_media_type, params = parse_header_parameters(accepted_media_type)
+            if params.get('indent'):
+                options |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=self.default, option=options)
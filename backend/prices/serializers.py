@@ -1,3 +1,4 @@
+from django.db import models
 from rest_framework import serializers
 from .models import Currency, PriceType, ProductPrice
 
@@ -15,8 +16,81 @@ class PriceTypeSerializer(serializers.ModelSerializer):
         fields = ["id", "code", "label"]
 
 
+# Process-wide {iso_code: Currency} cache, loaded on first use and dropped
+# by the Currency post_save/post_delete receiver in products/signals.py
+_CURRENCY_CACHE = None
+
+
+def invalidate_currency_codes():
+    """Forget the cached currencies; the next lookup reloads them."""
+    global _CURRENCY_CACHE
+    _CURRENCY_CACHE = None
+
+
+def get_currencies():
+    """Return the cached {iso_code: Currency} mapping, loading it if needed"""
+    global _CURRENCY_CACHE
+    if _CURRENCY_CACHE is None:
+        _CURRENCY_CACHE = {currency.iso_code: currency for currency in Currency.objects.all()}
+    return _CURRENCY_CACHE
+
+
+class CachedCurrencyField(serializers.Field):
+    """
+    Currency field exposed as its ISO code. Writes are resolved from the
+    shared currency cache instead of a per-value query.
+    """
+    
+    def get_attribute(self, instance):
+        """Read the ISO code straight from the FK column without loading the Currency row"""
+        return instance.serializable_value(self.source)
+    
+    def to_representation(self, value):
+        return value.iso_code if isinstance(value, Currency) else value
+    
+    def to_internal_value(self, data):
+        if not isinstance(data, str):
+            raise serializers.ValidationError("Currency must be an ISO code string")
+        try:
+            return get_currencies()[data]
+        except KeyError:
+            raise serializers.ValidationError(f"Currency '{data}' does not exist")
+
+
+class ProductPriceListSerializer(serializers.ListSerializer):
+    """
+    Batches the price_type and channel lookups for a list of prices: rows
+    whose relations were not select_related get them attached from one
+    in_bulk query per relation, instead of one query per row.
+    """
+    related_fields = ('price_type', 'channel')
+
+    def to_representation(self, data):
+        prices = list(data.all() if isinstance(data, models.manager.BaseManager) else data)
+        # products.ProductPrice and prices.ProductPrice share these relations
+        opts = prices[0]._meta if prices else None
+        for name in self.related_fields if opts else ():
+            field = opts.get_field(name)
+            missing = [
+                price for price in prices
+                if getattr(price, field.attname) is not None and not field.is_cached(price)
+            ]
+            if not missing:
+                continue
+            related = field.related_model._default_manager.in_bulk(
+                {getattr(price, field.attname) for price in missing}
+            )
+            for price in missing:
+                field.set_cached_value(price, related.get(getattr(price, field.attname)))
+        return super().to_representation(prices)
+
+
 class PriceTypeSlugOrIdField(serializers.RelatedField):
-    """Custom field that accepts either the PriceType ID or code (slug)"""
+    """
+    Custom field that accepts either the PriceType ID or code (slug).
+    Resolved price types are memoized in the serializer context, so a type
+    repeated across one request (e.g. a bulk import) is looked up only once.
+    """
     
     def to_representation(self, value):
         """Return the code (slug) for the price type"""
@@ -24,20 +98,30 @@ class PriceTypeSlugOrIdField(serializers.RelatedField):
     
     def to_internal_value(self, data):
         """Accept either an ID (integer) or code (string)"""
-        try:
-            # First, try to interpret as an integer (ID)
-            if isinstance(data, str) and data.isdigit():
-                price_type = PriceType.objects.get(id=int(data))
-                return price_type
-            elif isinstance(data, int):
-                price_type = PriceType.objects.get(id=data)
-                return price_type
-                
-            # If that fails, try as a code (string)
-            price_type = PriceType.objects.get(code=data)
-            return price_type
-        except (PriceType.DoesNotExist, ValueError):
+        # Ids and codes get separate slots, so the code "5" never stands in
+        # for the price type with id 5
+        cache = self.context.setdefault('_pk_cache', {})
+        label = PriceType._meta.label
+
+        # First, try to interpret as an integer (ID)
+        if isinstance(data, int) or (isinstance(data, str) and data.isdigit()):
+            key = (label, 'pk', int(data))
+            if key not in cache:
+                cache[key] = PriceType.objects.filter(id=int(data)).first()
+            if cache[key] is not None:
+                return cache[key]
+
+        # If that fails, try as a code (string); digit-only codes land here
+        # when no price type has that id
+        if not isinstance(data, str):
             raise serializers.ValidationError(f"PriceType with ID/code '{data}' does not exist")
+        key = (label, 'code', data)
+        if key not in cache:
+            try:
+                cache[key] = PriceType.objects.get(code=data)
+            except PriceType.DoesNotExist:
+                raise serializers.ValidationError(f"PriceType with ID/code '{data}' does not exist")
+        return cache[key]
 
 
 class ProductPriceSerializer(serializers.ModelSerializer):
@@ -45,7 +129,7 @@ class ProductPriceSerializer(serializers.ModelSerializer):
     price_type_display = serializers.CharField(source="price_type.label", read_only=True)
     channel_name = serializers.CharField(source="channel.name", read_only=True)
     label = serializers.CharField(source="price_type.label", read_only=True)
-    currency = serializers.SlugRelatedField(slug_field="iso_code", queryset=Currency.objects.all())
+    currency = CachedCurrencyField()
     
     class Meta:
         model = ProductPrice
@@ -54,4 +138,5 @@ class ProductPriceSerializer(serializers.ModelSerializer):
             "channel", "channel_name", "amount", "valid_from", 
             "valid_to", "created_at", "updated_at"
         ]
-        read_only_fields = ["id", "created_at", "updated_at", "price_type_display", "label"] 
\ No newline at end of file
+        read_only_fields = ["id", "created_at", "updated_at", "price_type_display", "label"]
+        list_serializer_class = ProductPriceListSerializer 
\ No newline at end of file
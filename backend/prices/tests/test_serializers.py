@@ -0,0 +1,44 @@
+"""
+Tests for the prices app serializers
+"""
+from django.test import TestCase
+from rest_framework import serializers
+
+from organizations.models import Organization
+from prices.models import PriceType
+from prices.serializers import PriceTypeSlugOrIdField
+
+
+class PriceTypeSlugOrIdFieldTest(TestCase):
+    """Test cases for resolving price types by ID or code"""
+
+    @classmethod
+    def setUpTestData(cls):
+        org = Organization.objects.create(name="Price Type Field Org", default_locale="")
+        cls.retail = PriceType.objects.create(code="retail", label="Retail", organization=org)
+        # A digit-only code that is not the id of any price type
+        cls.numbered = PriceType.objects.create(code="900001", label="Numbered", organization=org)
+
+    def setUp(self):
+        self.field = PriceTypeSlugOrIdField(queryset=PriceType.objects.all())
+        self.field._context = {}
+
+    def test_resolves_ids_and_codes(self):
+        self.assertEqual(self.field.to_internal_value(self.retail.id), self.retail)
+        self.assertEqual(self.field.to_internal_value(str(self.retail.id)), self.retail)
+        self.assertEqual(self.field.to_internal_value("retail"), self.retail)
+
+    def test_code_that_looks_like_an_id(self):
+        self.assertEqual(self.field.to_internal_value("900001"), self.numbered)
+        with self.assertRaises(serializers.ValidationError):
+            self.field.to_internal_value(900001)
+
+    def test_repeated_values_are_looked_up_once(self):
+        with self.assertNumQueries(2):
+            for value in ("retail", self.numbered.id, "retail", str(self.numbered.id)):
+                self.field.to_internal_value(value)
+
+    def test_unknown_value(self):
+        for value in ("missing", 0, ["retail"]):
+            with self.assertRaises(serializers.ValidationError):
+                self.field.to_internal_value(value)
@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '10027_merge_20250518_1507'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='completeness_cache',
+            field=models.PositiveSmallIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='missing_fields_cache',
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '10028_product_completeness_cache'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='attributegroupitem',
+            index=models.Index(fields=['group', 'order'], name='agi_group_order_idx'),
+        ),
+    ]
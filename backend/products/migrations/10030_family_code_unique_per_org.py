@@ -0,0 +1,24 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '10029_attributegroupitem_group_order_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='family',
+            name='code',
+            field=models.CharField(max_length=64),
+        ),
+        migrations.AddConstraint(
+            model_name='family',
+            constraint=models.UniqueConstraint(fields=('code', 'organization'), name='uniq_family_code_org'),
+        ),
+        migrations.AddConstraint(
+            model_name='family',
+            constraint=models.UniqueConstraint(condition=models.Q(('organization__isnull', True)), fields=('code',), name='uniq_family_code_no_org'),
+        ),
+    ]
@@ -3,6 +3,7 @@ from django.conf import settings
 from django.utils import timezone
 from django.contrib.auth import get_user_model
 import json
+import orjson
 from mptt.models import MPTTModel, TreeForeignKey
 
 User = get_user_model()
@@ -83,7 +84,7 @@ class Family(models.Model):
     """
     Represents a product family that can have associated attribute groups
     """
-    code = models.CharField(max_length=64, unique=True)
+    code = models.CharField(max_length=64)
     label = models.CharField(max_length=255)
     description = models.TextField(blank=True)
     organization = models.ForeignKey("organizations.Organization", on_delete=models.PROTECT, db_index=True, null=True)
@@ -99,6 +100,16 @@ class Family(models.Model):
         indexes = [
             models.Index(fields=['organization']),
         ]
+        constraints = [
+            models.UniqueConstraint(fields=['code', 'organization'], name='uniq_family_code_org'),
+            # NULLs never collide in the constraint above, so families without
+            # an organization keep their codes unique on their own
+            models.UniqueConstraint(
+                fields=['code'],
+                condition=models.Q(organization__isnull=True),
+                name='uniq_family_code_no_org'
+            ),
+        ]
 
     def __str__(self):
         return self.label
@@ -129,6 +140,16 @@ class Product(models.Model):
     tags = models.TextField(blank=True, null=True)
     attributes = models.TextField(blank=True, null=True)
     
+    # Denormalized completeness data, cleared on relevant writes (NULL = stale)
+    completeness_cache = models.PositiveSmallIntegerField(null=True, blank=True, editable=False)
+    missing_fields_cache = models.JSONField(null=True, blank=True, editable=False)
+    
+    # Fields get_completeness()/get_missing_fields() read from the row itself
+    COMPLETENESS_FIELDS = frozenset({
+        'name', 'sku', 'description', 'category', 'category_id', 'brand',
+        'barcode', 'tags', 'organization', 'organization_id',
+    })
+    
     class Meta:
         """Meta options for Product"""
         verbose_name = "Product"
@@ -152,7 +173,7 @@ class Product(models.Model):
         if not self.tags:
             return []
         try:
-            return json.loads(self.tags)
+            return orjson.loads(self.tags)
         except json.JSONDecodeError as e:
             print(f"ERROR: Invalid JSON in tags for product {self.id}: {e}")
             return []
@@ -220,6 +241,45 @@ class Product(models.Model):
             
         return round((completed_weight / total_weight) * 100)
     
+    def save(self, *args, **kwargs):
+        # Writing a field completeness depends on makes the cache columns
+        # stale; clear them in the same write instead of recomputing here
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or self.COMPLETENESS_FIELDS.intersection(update_fields):
+            self.completeness_cache = None
+            self.missing_fields_cache = None
+            if update_fields is not None:
+                kwargs['update_fields'] = set(update_fields) | {'completeness_cache', 'missing_fields_cache'}
+        super().save(*args, **kwargs)
+
+    def _fill_completeness_cache(self):
+        """Compute the cache columns on this instance without writing them"""
+        self.completeness_cache = self.get_completeness()
+        self.missing_fields_cache = self.get_missing_fields()
+
+    def refresh_completeness_cache(self):
+        """
+        Recompute completeness_cache and missing_fields_cache and persist them
+        with a queryset update so no save signals are fired.
+        """
+        self._fill_completeness_cache()
+        Product.objects.filter(pk=self.pk).update(
+            completeness_cache=self.completeness_cache,
+            missing_fields_cache=self.missing_fields_cache
+        )
+
+    def get_cached_completeness(self):
+        """Return completeness_cache, computing it in memory if stale"""
+        if self.completeness_cache is None:
+            self._fill_completeness_cache()
+        return self.completeness_cache
+
+    def get_cached_missing_fields(self):
+        """Return missing_fields_cache, computing it in memory if stale"""
+        if self.missing_fields_cache is None:
+            self._fill_completeness_cache()
+        return self.missing_fields_cache or []
+
     def _safely_check_field(self, check_function):
         """Helper to safely check field conditions with error handling"""
         try:
@@ -233,7 +293,7 @@ class Product(models.Model):
         try:
             if not self.tags:
                 return False
-            tags = json.loads(self.tags)
+            tags = orjson.loads(self.tags)
             return bool(tags and len(tags) > 0)
         except json.JSONDecodeError:
             return False
@@ -301,7 +361,7 @@ class Product(models.Model):
             
         # Check JSON fields safely
         try:
-            if not self.tags or not json.loads(self.tags or '[]'):
+            if not self.tags or not orjson.loads(self.tags or '[]'):
                 missing.append({'field': 'Tags', 'weight': 1})
         except json.JSONDecodeError:
             missing.append({'field': 'Tags', 'weight': 1})
@@ -698,6 +758,10 @@ class AttributeGroupItem(models.Model):
     class Meta:
         unique_together = ('group', 'attribute')
         ordering = ('order',)
+        indexes = [
+            # Serves the per-group item prefetch ordered by (group_id, order)
+            models.Index(fields=['group', 'order'], name='agi_group_order_idx'),
+        ]
         
     def __str__(self):
         return f"{self.attribute.code} in {self.group.name} (Order: {self.order})"
@@ -1,29 +1,247 @@
 from rest_framework import serializers
-import json
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
+import logging
+import math
+import re
+import threading
+import bleach
+import orjson
+import phonenumbers
 from .models import Product, Activity, ProductRelation, ProductAsset, ProductEvent, Attribute, AttributeValue, AttributeGroupItem, AttributeGroup, SalesChannel, ProductPrice, Category, AttributeOption, AssetBundle, Family, FamilyAttributeGroup, ProductFamilyOverride, Locale
-from django.db.models import Sum, F, Count, Case, When, Value, FloatField
-from decimal import Decimal
+from django.db.models import Sum, F, Count, Case, When, Value, FloatField, Prefetch, Q
+from decimal import Decimal, InvalidOperation
 from django.conf import settings
 from django.utils import timezone
+from datetime import datetime
 from django.db.models.functions import TruncDay
 from kernlogic.utils import get_user_organization
-from django.core.validators import MinValueValidator
+from django.core.validators import MinValueValidator, URLValidator, validate_email
 from django.core.exceptions import ValidationError
-from django.db import transaction
-from prices.serializers import PriceTypeSlugOrIdField  # local import to avoid circular refs
-from prices.models import PriceType, Currency
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import IntegrityError, models, transaction
+from django.core.files.storage import default_storage
+from prices.serializers import PriceTypeSlugOrIdField, CachedCurrencyField, ProductPriceListSerializer, get_currencies  # local import to avoid circular refs
+from prices.models import PriceType
+
+logger = logging.getLogger(__name__)
+
+# ISO-8601 date format regex (YYYY-MM-DD), compiled once for AttributeValueSerializer.validate.
+# Named groups let the validator build the date directly instead of re-parsing with strptime
+ISO_DATE_PATTERN = re.compile(r'^(?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2})\Z', re.ASCII)
+
+# Tags and attributes kept when sanitizing rich_text attribute values
+_ALLOWED_TAGS = frozenset([
+    'a', 'abbr', 'acronym', 'b', 'blockquote', 'code', 'em', 'i', 'li', 'ol', 'p',
+    'strong', 'ul', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'span', 'br', 'hr'
+])
+_ALLOWED_ATTRS = {
+    'a': ['href', 'title', 'target'],
+    'abbr': ['title'],
+    'acronym': ['title'],
+    'span': ['style'],
+}
+
+# Stateless validators shared by AttributeValueSerializer.validate
+_URL_VALIDATOR = URLValidator()
+# Default region for phone numbers written without a country code
+_PHONE_REGION = 'US'
+
+_cleaner_tls = threading.local()
+
+def _cleaner():
+    """
+    Return this thread's bleach.Cleaner. Building a Cleaner sets up the
+    html5lib parser and sanitizer, so it is done once per thread rather
+    than on every bleach.clean() call; Cleaner instances are not thread-safe.
+    """
+    cleaner = getattr(_cleaner_tls, 'cleaner', None)
+    if cleaner is None:
+        cleaner = _cleaner_tls.cleaner = bleach.Cleaner(tags=_ALLOWED_TAGS, attributes=_ALLOWED_ATTRS)
+    return cleaner
+
+def _get_request_organization(request):
+    """
+    Return get_user_organization(request.user), memoized on the request so
+    per-row validation on bulk payloads resolves the membership only once.
+    """
+    user = request.user
+    cached = getattr(request, '_org_cache', None)
+    if cached is None or cached[0] is not user:
+        cached = (user, get_user_organization(user))
+        request._org_cache = cached
+    return cached[1]
+
+def _absolute_url(request, url):
+    """
+    request.build_absolute_uri(url) for site-relative URLs via a scheme+host
+    prefix memoized on the request, so a page of assets builds it once.
+    Absolute and scheme-relative URLs go through build_absolute_uri unchanged.
+    """
+    if not url.startswith('/') or url.startswith('//'):
+        return request.build_absolute_uri(url)
+    prefix = getattr(request, '_url_prefix', None)
+    if prefix is None:
+        prefix = request._url_prefix = request.build_absolute_uri('/')[:-1]
+    return prefix + url
+
+class CachedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    PrimaryKeyRelatedField that memoizes resolved objects in the serializer
+    context, so a pk repeated across one request (e.g. bulk create) is
+    looked up only once.
+    """
+    def to_internal_value(self, data):
+        cache = self.context.setdefault('_pk_cache', {})
+        key = (self.queryset.model._meta.label, str(data))
+        if key not in cache:
+            cache[key] = super().to_internal_value(data)
+        return cache[key]
+
+class CachedRepresentationMixin:
+    """
+    Memoizes to_representation per (serializer class, pk) in the serializer
+    context. For read-only nested serializers whose instances repeat across
+    one response, such as the same sales channel under many prices.
+    """
+    def to_representation(self, instance):
+        cache = self.context.setdefault('_repr_cache', {})
+        key = (type(self), instance.pk)
+        if key not in cache:
+            cache[key] = super().to_representation(instance)
+        return cache[key]
+
+class PlannedRepresentationMixin:
+    """
+    to_representation driven by a per-serializer plan built on first use:
+    fields backed by a concrete model column read the attribute directly and method fields call a
+    pre-bound getter, skipping DRF's per-row field iteration and
+    get_attribute chain. Every other field takes DRF's normal path.
+    """
+    _PLAIN = 0
+    _METHOD = 1
+    _GENERIC = 2
+
+    def _representation_plan(self):
+        plan = self.__dict__.get('_repr_plan')
+        if plan is None:
+            plan = []
+            columns = {f.attname for f in self.Meta.model._meta.concrete_fields}
+            for field in self._readable_fields:
+                if isinstance(field, serializers.SerializerMethodField):
+                    plan.append((self._METHOD, field, getattr(self, field.method_name)))
+                elif (
+                    len(field.source_attrs) == 1
+                    and field.source_attrs[0] in columns
+                    and type(field).get_attribute is serializers.Field.get_attribute
+                ):
+                    plan.append((self._PLAIN, field, field.source_attrs[0]))
+                else:
+                    plan.append((self._GENERIC, field, None))
+            self._repr_plan = plan
+        return plan
+
+    def to_representation(self, instance):
+        ret = {}
+        for kind, field, target in self._representation_plan():
+            if kind == self._METHOD:
+                ret[field.field_name] = target(instance)
+                continue
+            if kind == self._PLAIN:
+                attribute = getattr(instance, target)
+            else:
+                try:
+                    attribute = field.get_attribute(instance)
+                except SkipField:
+                    continue
+            check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+            ret[field.field_name] = None if check_for_none is None else field.to_representation(attribute)
+        return ret
+
+class TagListField(serializers.ListField):
+    """
+    Product.tags is a TextField holding a JSON array. Decode it once with
+    orjson on output instead of letting ListField walk the string per character.
+    """
+    def __init__(self, **kwargs):
+        kwargs.setdefault('child', serializers.CharField())
+        super().__init__(**kwargs)
+
+    def to_representation(self, data):
+        if isinstance(data, list):
+            return data
+        if not data:
+            return []
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            logger.exception("Error decoding tags %r", data)
+            return []
+
+def _build_category_tree(nodes):
+    """
+    Assemble nested category dicts from nodes ordered by (tree_id, lft).
+    Returns a dict of category id -> node dict with its 'children' filled in.
+    """
+    by_id = {}
+    for node in nodes:
+        data = {'id': node.id, 'name': node.name, 'parent': node.parent_id, 'children': []}
+        by_id[node.id] = data
+        # MPTT ordering guarantees a parent is visited before its children
+        parent = by_id.get(node.parent_id)
+        if parent is not None:
+            parent['children'].append(data)
+    return by_id
+
+class CategoryTreeListSerializer(serializers.ListSerializer):
+    """Serializes several category subtrees with a single MPTT range query"""
+    def to_representation(self, data):
+        roots = list(data.all() if isinstance(data, models.Manager) else data)
+        if not roots:
+            return []
+        subtrees = Q()
+        for root in roots:
+            subtrees |= Q(tree_id=root.tree_id, lft__gte=root.lft, rght__lte=root.rght)
+        by_id = _build_category_tree(Category.objects.filter(subtrees).order_by('tree_id', 'lft'))
+        return [by_id[root.id] for root in roots]
 
 # --- NEW CategorySerializer ---
 class CategorySerializer(serializers.ModelSerializer):
-    """Serializer for hierarchical category model"""
+    """
+    Serializer for hierarchical category model.
+    The whole subtree under a node is loaded with one MPTT range query and
+    nested in memory, rather than one get_children() query per node.
+    """
     children = serializers.SerializerMethodField()
 
     class Meta:
         model = Category
         fields = ['id', 'name', 'parent', 'children']
+        list_serializer_class = CategoryTreeListSerializer
+
+    def _subtree(self, obj):
+        by_id = _build_category_tree(obj.get_descendants(include_self=True))
+        if obj.id not in by_id:
+            # lft/rght on an in-memory node go stale when the tree changes under it
+            obj.refresh_from_db(fields=['tree_id', 'lft', 'rght', 'level'])
+            by_id = _build_category_tree(obj.get_descendants(include_self=True))
+        return by_id[obj.id]
 
     def get_children(self, obj):
-        return CategorySerializer(obj.get_children(), many=True).data
+        return self._subtree(obj)['children']
+
+    def to_representation(self, instance):
+        return self._subtree(instance)
+
+class CategoryFlatSerializer(serializers.ModelSerializer):
+    """
+    Category without its subtree, for ancestor chains such as
+    ProductSerializer.category where nested children are never needed.
+    """
+    class Meta:
+        model = Category
+        fields = ['id', 'name', 'parent']
+        read_only_fields = fields
 
 # Simplified CategorySerializer for nested usage
 class SimpleCategorySerializer(serializers.ModelSerializer):
@@ -43,23 +261,16 @@ class SimpleCategorySerializer(serializers.ModelSerializer):
         read_only_fields = ['parent_name']
 
     def get_parent_name(self, obj):
-        return obj.parent.name if obj.parent else None
-    
-    def to_representation(self, instance):
-        """Add additional error handling for parent field"""
-        try:
-            return super().to_representation(instance)
-        except Exception as e:
-            # If there's an error in serialization, return a minimal representation
-            return {
-                'id': instance.id,
-                'name': instance.name,
-                'parent_id': instance.parent_id if hasattr(instance, 'parent_id') else None,
-                'parent_name': instance.parent.name if hasattr(instance, 'parent') and instance.parent else None
-            }
+        if not obj.parent_id:
+            return None
+        # Per-request cache of parent_id -> name, shared through the serializer context
+        cache = self.context.setdefault('_parent_name_cache', {})
+        if obj.parent_id not in cache:
+            cache[obj.parent_id] = obj.parent.name
+        return cache[obj.parent_id]
 
 # --- NEW SalesChannel Serializer ---
-class SalesChannelSerializer(serializers.ModelSerializer):
+class SalesChannelSerializer(CachedRepresentationMixin, serializers.ModelSerializer):
     """Serializer for sales channels"""
     class Meta:
         model = SalesChannel
@@ -75,13 +286,10 @@ class ProductPriceSerializer(serializers.ModelSerializer):
     price_type_display = serializers.CharField(source='price_type.label', read_only=True)  # keep for BC
 
     # Always expose currency as ISO code string (e.g. "USD") to match frontend formatCurrency util
-    currency = serializers.SlugRelatedField(
-        slug_field='iso_code',
-        queryset=Currency.objects.all()
-    )
+    currency = CachedCurrencyField()
 
     channel = SalesChannelSerializer(read_only=True)
-    channel_id = serializers.PrimaryKeyRelatedField(
+    channel_id = CachedPrimaryKeyRelatedField(
         queryset=SalesChannel.objects.all(),
         source='channel',
         write_only=True,
@@ -97,6 +305,7 @@ class ProductPriceSerializer(serializers.ModelSerializer):
             'valid_from', 'valid_to', 'created_at', 'updated_at'
         ]
         read_only_fields = ['id', 'created_at', 'updated_at', 'price_type_display', 'label']
+        list_serializer_class = ProductPriceListSerializer
 
 # ProductImageSerializer has been removed as part of the legacy image code cleanup
 
@@ -132,27 +341,83 @@ class ProductFamilyOverrideSerializer(serializers.ModelSerializer):
         
         return override
 
-class ProductSerializer(serializers.ModelSerializer):
+def _category_chains(by_id, category_ids):
+    """
+    Map each category id to its [root, ..., leaf] node list by walking the
+    parent pointers of an already-built ``_build_category_tree`` dict.
+    """
+    chains = {}
+    for category_id in category_ids:
+        chain = []
+        node = by_id.get(category_id)
+        while node is not None:
+            chain.append(node)
+            node = by_id.get(node['parent'])
+        chain.reverse()
+        chains[category_id] = chain
+    return chains
+
+def _ancestor_chains(categories):
+    """
+    Map each category id to its [root, ..., leaf] chain of
+    CategoryFlatSerializer-shaped dicts, loading the ancestors of every
+    given category with one query. ``categories`` maps ids to Category
+    instances, or to None for ones that still need loading.
+    """
+    unloaded = [category_id for category_id, category in categories.items() if category is None]
+    if unloaded:
+        categories = {**categories, **Category.objects.only('tree_id', 'lft', 'rght').in_bulk(unloaded)}
+    ancestors = Q()
+    for category in categories.values():
+        ancestors |= Q(tree_id=category.tree_id, lft__lte=category.lft, rght__gte=category.rght)
+    nodes = Category.objects.filter(ancestors).only('id', 'name', 'parent_id').order_by('tree_id', 'lft')
+    by_id = {node.id: {'id': node.id, 'name': node.name, 'parent': node.parent_id} for node in nodes}
+    return _category_chains(by_id, categories)
+
+class ProductCategoryListSerializer(serializers.ListSerializer):
+    """
+    List serializer for ProductSerializer that resolves the category chains
+    and attribute definitions of every product on the page up front, one
+    query each, before serializing them.
+    """
+    def to_representation(self, data):
+        items = list(data.all() if isinstance(data, models.Manager) else data)
+        cache = self.context.setdefault('_cat_repr_cache', {})
+        categories = {
+            p.category_id: p.category if Product.category.is_cached(p) else None
+            for p in items if p.category_id and p.category_id not in cache
+        }
+        if categories:
+            cache.update(_ancestor_chains(categories))
+        # Resolve the attributes behind every prefetched value on the page at once
+        self.child._attributes_by_id({
+            av.attribute_id
+            for p in items if 'attribute_values' in getattr(p, '_prefetched_objects_cache', {})
+            for av in p.attribute_values.all()
+        })
+        return super().to_representation(items)
+
+class ProductSerializer(PlannedRepresentationMixin, serializers.ModelSerializer):
     """
     Serializer for Product model
     """
     created_by = serializers.ReadOnlyField(source='created_by.email')
     prices = ProductPriceSerializer(many=True, read_only=True)
-    tags = serializers.ListField(child=serializers.CharField(), required=False)
+    tags = TagListField(required=False)
     attribute_values = serializers.SerializerMethodField(read_only=True)
     completeness_percent = serializers.SerializerMethodField(read_only=True)
     missing_fields = serializers.SerializerMethodField(read_only=True)
     assets = serializers.SerializerMethodField(read_only=True)
     primary_asset = serializers.SerializerMethodField(read_only=True)
     category = serializers.SerializerMethodField()
-    category_id = serializers.PrimaryKeyRelatedField(
+    category_id = CachedPrimaryKeyRelatedField(
         source='category',
         queryset=Category.objects.all(),
         required=False,
         allow_null=True,
         write_only=True
     )
-    family = serializers.PrimaryKeyRelatedField(
+    family = CachedPrimaryKeyRelatedField(
         queryset=Family.objects.all(),
         required=False,
         allow_null=True
@@ -171,29 +436,37 @@ class ProductSerializer(serializers.ModelSerializer):
             'family_overrides',
             'effective_attribute_groups',
         ]
+        list_serializer_class = ProductCategoryListSerializer
         read_only_fields = ['id', 'created_at', 'updated_at', 'completeness_percent', 
                            'missing_fields', 'assets', 'primary_asset', 'organization', 
                            'created_by', 'attribute_values',
                            'prices', 'category', 'family_overrides', 'effective_attribute_groups']
     
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Return the queryset with every relation this serializer renders
+        select/prefetch-related, so serializing N products costs a fixed
+        number of queries instead of several per product.
+        """
+        return queryset.select_related(
+            'category', 'created_by', 'organization', 'family'
+        ).prefetch_related(
+            Prefetch('prices', queryset=ProductPrice.objects.select_related('price_type', 'channel', 'currency')),
+            Prefetch('assets', queryset=ProductAsset.objects.select_related('uploaded_by')),
+            # Attributes repeat across products; they are resolved once per
+            # request through _attributes_by_id rather than joined per value
+            Prefetch('attribute_values', queryset=AttributeValue.objects.all()),
+            'family_overrides',
+            'family__attribute_groups',
+        )
+    
     def to_representation(self, instance):
         """
-        Override to ensure properly handle tags and ensure category is properly represented
+        Override to ensure category is properly represented. Tags are decoded by TagListField.
         """
         representation = super().to_representation(instance)
         
-        # Ensure tags are properly decoded from JSON string to list
-        try:
-            if instance.tags:
-                if isinstance(instance.tags, str):
-                    representation['tags'] = json.loads(instance.tags)
-                elif not representation.get('tags'):
-                    # If tags field exists but isn't populated in representation
-                    representation['tags'] = instance.get_tags()
-        except (json.JSONDecodeError, Exception) as e:
-            print(f"Error decoding tags for product {instance.id}: {e}")
-            representation['tags'] = []
-        
         # Ensure category is an array
         if 'category' not in representation:
             representation['category'] = []
@@ -217,20 +490,20 @@ class ProductSerializer(serializers.ModelSerializer):
             if isinstance(tags_data, list):
                 # Clean up tags - make sure they're all valid strings
                 cleaned_tags = [str(tag).strip() for tag in tags_data if tag]
-                validated_data['tags'] = json.dumps(cleaned_tags)
+                validated_data['tags'] = orjson.dumps(cleaned_tags).decode()
             elif isinstance(tags_data, str):
                 # Handle case where tags might come as a JSON string already
                 try:
                     # If it's valid JSON, use it directly
-                    parsed = json.loads(tags_data)
+                    parsed = orjson.loads(tags_data)
                     if isinstance(parsed, list):
                         validated_data['tags'] = tags_data
                     else:
                         # It's JSON but not a list, convert to a list with one item
-                        validated_data['tags'] = json.dumps([str(parsed)])
-                except json.JSONDecodeError:
+                        validated_data['tags'] = orjson.dumps([str(parsed)]).decode()
+                except orjson.JSONDecodeError:
                     # Not valid JSON, treat as a single tag
-                    validated_data['tags'] = json.dumps([tags_data])
+                    validated_data['tags'] = orjson.dumps([tags_data]).decode()
             elif tags_data is None:
                 # Set to empty array if tags is explicitly null
                 validated_data['tags'] = '[]'
@@ -248,35 +521,30 @@ class ProductSerializer(serializers.ModelSerializer):
         instance = getattr(self, 'instance', None)
         if instance and instance.sku == value:
             return value
-            
-        # Get the organization using the utility function
-        try:
-            organization = get_user_organization(request.user)
-            
-            # Check if a product with this SKU already exists in this organization
-            if organization and Product.objects.filter(
-                created_by=request.user,
-                organization=organization,
-                sku=value
-            ).exclude(
-                pk=instance.pk if instance else None
-            ).exists():
+
+        # Bulk endpoints pre-load the organization's SKUs once per request
+        existing_skus = self.context.get('_existing_skus')
+        if existing_skus is not None and instance is None:
+            if value in existing_skus:
                 raise serializers.ValidationError(
                     "A product with this SKU already exists in your organization."
                 )
-        except Exception as e:
-            # If there's an error getting the organization, log it and use the old check
-            print(f"Error during SKU validation: {str(e)}")
-            if Product.objects.filter(
-                created_by=request.user,
-                sku=value
-            ).exclude(
-                pk=instance.pk if instance else None
-            ).exists():
-                raise serializers.ValidationError(
-                    "A product with this SKU already exists."
-                )
-                
+            return value
+            
+        # One EXISTS against the (organization, sku) unique index; an insert
+        # racing past it is reported the same way by _save_guarding_sku
+        organization = _get_request_organization(request)
+        if organization:
+            duplicates = Product.objects.filter(organization=organization, sku=value)
+            message = "A product with this SKU already exists in your organization."
+        else:
+            duplicates = Product.objects.filter(created_by=request.user, sku=value)
+            message = "A product with this SKU already exists."
+        if instance:
+            duplicates = duplicates.exclude(pk=instance.pk)
+        if duplicates.exists():
+            raise serializers.ValidationError(message)
+
         return value
 
     def validate_price(self, value):
@@ -289,75 +557,92 @@ class ProductSerializer(serializers.ModelSerializer):
 
     def get_completeness_percent(self, obj):
         """Return the completeness percentage of the product"""
-        try:
-            return obj.get_completeness()
-        except Exception as e:
-            print(f"ERROR: Failed to calculate completeness for product {obj.id}: {str(e)}")
-            return 0
+        return obj.get_cached_completeness()
 
     def get_missing_fields(self, obj):
         """Return a list of missing fields for the product"""
-        try:
-            return obj.get_missing_fields()
-        except Exception as e:
-            print(f"ERROR: Failed to get missing fields for product {obj.id}: {str(e)}")
-            return []
+        return obj.get_cached_missing_fields()
 
-    def get_assets(self, obj):
-        """Return a list of assets associated with the product"""
-        try:
-            assets = obj.assets.all()
+    def _serialized_assets(self, obj):
+        """
+        Serialize the product's assets once for both ``assets`` and
+        ``primary_asset``. Prefetched rows are used as-is; otherwise the rows
+        are streamed with iterator() so large galleries are not materialized
+        as model instances all at once.
+        """
+        if not hasattr(obj, '_serialized_assets'):
+            if 'assets' in getattr(obj, '_prefetched_objects_cache', {}):
+                assets = obj.assets.all()
+            else:
+                assets = obj.assets.select_related('uploaded_by').iterator(chunk_size=500)
             request = self.context.get('request')
-            
-            # Use the ProductAssetSerializer to serialize the assets
-            serializer = ProductAssetSerializer(
-                assets, 
-                many=True, 
+            obj._serialized_assets = ProductAssetSerializer(
+                assets,
+                many=True,
                 context={'request': request} if request else {}
-            )
-            return serializer.data
-        except Exception as e:
-            print(f"ERROR: Failed to get assets for product {obj.id}: {str(e)}")
-            return []
+            ).data
+        return obj._serialized_assets
+
+    def get_assets(self, obj):
+        """Return a list of assets associated with the product"""
+        return self._serialized_assets(obj)
 
     def get_primary_asset(self, obj):
         """Return the primary asset associated with the product"""
-        try:
-            primary_asset = obj.assets.filter(is_primary=True).first()
-            if primary_asset:
-                request = self.context.get('request')
-                serializer = ProductAssetSerializer(
-                    primary_asset, 
-                    context={'request': request} if request else {}
-                )
-                return serializer.data
-            return None
-        except Exception as e:
-            print(f"ERROR: Failed to get primary asset for product {obj.id}: {str(e)}")
-            return None
+        return next((asset for asset in self._serialized_assets(obj) if asset['is_primary']), None)
+
+    def _attributes_by_id(self, attribute_ids):
+        """
+        Per-request {id: Attribute} lookup shared through the serializer
+        context; only ids not seen yet in this request are fetched.
+        """
+        cache = self.context.setdefault('_attribute_cache', {})
+        missing = set(attribute_ids) - cache.keys()
+        if missing:
+            cache.update(
+                Attribute.objects.only('id', 'code', 'label', 'data_type').in_bulk(missing)
+            )
+        return cache
 
     def get_attribute_values(self, obj):
         """Return the attribute values for this product"""
-        try:
-            from products.serializers import AttributeValueDetailSerializer
-            attribute_values = obj.attribute_values.all()
-            serializer = AttributeValueDetailSerializer(attribute_values, many=True)
-            return serializer.data
-        except Exception as e:
-            print(f"ERROR: Failed to get attribute values for product {obj.id}: {str(e)}")
-            return []
+        # Build the AttributeValueDetailSerializer shape directly from the
+        # prefetched rows (see setup_eager_loading) instead of running DRF's
+        # field pipeline for every value
+        values = list(obj.attribute_values.all())
+        attributes = self._attributes_by_id(av.attribute_id for av in values)
+        return [
+            {
+                'id': av.id,
+                'attribute': av.attribute_id,
+                'product': av.product_id,
+                'organization': av.organization_id,
+                'value': av.value,
+                'locale': av.locale_id,
+                'channel': av.channel,
+                'attribute_code': attributes[av.attribute_id].code,
+                'attribute_label': attributes[av.attribute_id].label,
+                'attribute_type': attributes[av.attribute_id].data_type,
+            }
+            for av in values
+        ]
 
     def get_category(self, obj):
         """
         Return the full hierarchy for this product's category as an
         ordered list [root, ..., leaf], or [] if none.
         """
-        if not obj.category:
+        if not obj.category_id:
             return []
         
-        # Get all ancestors including self, ordered from root to leaf
-        ancestors = obj.category.get_ancestors(include_self=True)
-        return CategorySerializer(ancestors, many=True).data
+        # Ancestor chains are shared by many products, so serialize each
+        # category at most once per request
+        cache = self.context.setdefault('_cat_repr_cache', {})
+        if obj.category_id not in cache:
+            # Get all ancestors including self, ordered from root to leaf
+            ancestors = obj.category.get_ancestors(include_self=True)
+            cache[obj.category_id] = CategoryFlatSerializer(ancestors, many=True).data
+        return cache[obj.category_id]
 
     def validate_family(self, value):
         """
@@ -369,40 +654,19 @@ class ProductSerializer(serializers.ModelSerializer):
         if not instance or not value:
             return value
             
-        # Get all required attribute groups for this family
-        required_groups = FamilyAttributeGroup.objects.filter(
-            family=value,
-            required=True
-        ).select_related('attribute_group')
-        
-        # If no required groups, return early
-        if not required_groups:
-            return value
-            
-        # Get all attributes that are in required groups
-        required_attribute_ids = set()
-        for family_group in required_groups:
-            # Get all attributes in this group
-            group_attribute_ids = AttributeGroupItem.objects.filter(
-                group=family_group.attribute_group
-            ).values_list('attribute_id', flat=True)
-            required_attribute_ids.update(group_attribute_ids)
-            
-        # If no required attributes, return early
-        if not required_attribute_ids:
-            return value
-            
-        # Get all attribute values for this product
-        existing_attribute_ids = set(instance.attribute_values.values_list('attribute_id', flat=True))
-        
-        # Find missing required attributes
-        missing_attribute_ids = required_attribute_ids - existing_attribute_ids
+        # Attributes in the family's required groups that have no value on
+        # this product, resolved in a single query
+        required_attribute_ids = AttributeGroupItem.objects.filter(
+            group__families__family=value,
+            group__families__required=True
+        ).values('attribute_id')
+        missing_names = list(
+            Attribute.objects.filter(id__in=required_attribute_ids)
+            .exclude(id__in=instance.attribute_values.values('attribute_id'))
+            .values_list('label', flat=True)
+        )
         
-        if missing_attribute_ids:
-            # Get attribute details for error message
-            missing_attributes = Attribute.objects.filter(id__in=missing_attribute_ids)
-            missing_names = [attr.label for attr in missing_attributes]
-            
+        if missing_names:
             raise serializers.ValidationError(
                 f"This product is missing required attributes for this family: {', '.join(missing_names)}"
             )
@@ -419,29 +683,34 @@ class ProductSerializer(serializers.ModelSerializer):
         Products can ONLY have attribute groups through family inheritance and overrides,
         not through direct assignment.
         """
-        # Get family groups if a family is assigned
-        family_groups = []
+        # Get family groups if a family is assigned; .all() on both relations
+        # reads the lists prefetched by setup_eager_loading
+        family_groups = set()
         if obj.family:
-            family_groups = obj.family.attribute_groups.all().values_list(
-                'attribute_group_id', flat=True
-            )
+            family_groups = {fag.attribute_group_id for fag in obj.family.attribute_groups.all()}
             
         # Get overrides
-        removed_groups = obj.family_overrides.filter(removed=True).values_list(
-            'attribute_group_id', flat=True
-        )
-        added_groups = obj.family_overrides.filter(removed=False).values_list(
-            'attribute_group_id', flat=True
-        )
+        overrides = obj.family_overrides.all()
+        removed_groups = {o.attribute_group_id for o in overrides if o.removed}
+        added_groups = {o.attribute_group_id for o in overrides if not o.removed}
         
         # Calculate effective groups - strictly based on family and overrides
-        effective_group_ids = (set(family_groups) - set(removed_groups)) | set(added_groups)
+        effective_group_ids = (family_groups - removed_groups) | added_groups
+        if not effective_group_ids:
+            return []
         
-        # Get the actual groups and serialize them
-        if effective_group_ids:
-            effective_groups = AttributeGroup.objects.filter(id__in=effective_group_ids)
-            return AttributeGroupSerializer(effective_groups, many=True).data
-        return []
+        # Serialize each group once per request; products mostly share groups
+        cache = self.context.setdefault('_attr_group_cache', {})
+        missing = effective_group_ids - cache.keys()
+        if missing:
+            groups = AttributeGroupSerializer.setup_eager_loading(
+                AttributeGroup.objects.filter(id__in=missing)
+            )
+            for data in AttributeGroupSerializer(groups, many=True).data:
+                cache[data['id']] = data
+        # Same (order, id) ordering as AttributeGroup.Meta
+        groups = [cache[group_id] for group_id in effective_group_ids if group_id in cache]
+        return sorted(groups, key=lambda g: (g['order'], g['id']))
 
     def update(self, instance, validated_data):
         """
@@ -459,20 +728,53 @@ class ProductSerializer(serializers.ModelSerializer):
             with transaction.atomic():
                 instance.family_overrides.all().delete()
                 
-                for override_data in overrides_data:
-                    ProductFamilyOverride.objects.create(
-                        product=instance,
-                        attribute_group_id=override_data['attribute_group'],
-                        removed=override_data['removed'],
-                        organization=organization
-                    )
+                # One multi-row INSERT; a group repeated in the payload keeps
+                # its first entry instead of tripping the unique constraint
+                ProductFamilyOverride.objects.bulk_create(
+                    [
+                        ProductFamilyOverride(
+                            product=instance,
+                            attribute_group_id=override_data['attribute_group'],
+                            removed=override_data['removed'],
+                            organization=organization
+                        )
+                        for override_data in overrides_data
+                    ],
+                    batch_size=500,
+                    ignore_conflicts=True
+                )
         
         # Remove any attribute_groups data if present (we don't allow direct assignment)
         if 'attribute_groups' in validated_data:
             validated_data.pop('attribute_groups')
         
         # Continue with normal update
-        return super().update(instance, validated_data)
+        return self._save_guarding_sku(super().update, instance, validated_data)
+
+    def create(self, validated_data):
+        return self._save_guarding_sku(super().create, validated_data)
+
+    def _save_guarding_sku(self, save, *args):
+        """
+        Run save inside a savepoint and turn a (organization, sku) unique
+        constraint violation into the same error validate_sku raises.
+        """
+        try:
+            with transaction.atomic():
+                return save(*args)
+        except IntegrityError:
+            validated_data = args[-1]
+            instance = args[0] if len(args) > 1 else None
+            organization = validated_data.get('organization', getattr(instance, 'organization', None))
+            sku = validated_data.get('sku', getattr(instance, 'sku', None))
+            duplicates = Product.objects.filter(organization=organization, sku=sku)
+            if instance is not None:
+                duplicates = duplicates.exclude(pk=instance.pk)
+            if not duplicates.exists():
+                raise
+            raise serializers.ValidationError(
+                {'sku': ["A product with this SKU already exists in your organization."]}
+            )
 
 class ProductRelationSerializer(serializers.ModelSerializer):
     """Serializer for product relations"""
@@ -569,10 +871,21 @@ class IncompleteProductSerializer(serializers.ModelSerializer):
         """Return the detailed field completeness data"""
         return obj.get_field_completeness() if hasattr(obj, 'get_field_completeness') else []
 
+# (threshold, unit) pairs for FileSizeField, largest first
+_FILE_SIZE_UNITS = ((1 << 20, 'MB'), (1 << 10, 'KB'))
+
+class FileSizeField(serializers.ReadOnlyField):
+    """Byte count rendered as a human-readable size ("512 B", "1.5 KB", "2.0 MB")"""
+    def to_representation(self, size):
+        for threshold, unit in _FILE_SIZE_UNITS:
+            if size >= threshold:
+                return f"{size / threshold:.1f} {unit}"
+        return f"{size} B"
+
 class ProductAssetSerializer(serializers.ModelSerializer):
     file_url = serializers.SerializerMethodField()
     uploaded_by_name = serializers.SerializerMethodField()
-    file_size_formatted = serializers.SerializerMethodField()
+    file_size_formatted = FileSizeField(source='file_size')
     tags = serializers.ListField(child=serializers.CharField(), required=False)
     
     class Meta:
@@ -596,25 +909,16 @@ class ProductAssetSerializer(serializers.ModelSerializer):
         
     def get_file_url(self, obj):
         """Return absolute URL for the file"""
-        if obj.file:
-            return self.context['request'].build_absolute_uri(obj.file.url) if 'request' in self.context else obj.file.url
-        return None
+        if not obj.file:
+            return None
+        request = self.context.get('request')
+        return _absolute_url(request, obj.file.url) if request is not None else obj.file.url
     
     def get_uploaded_by_name(self, obj):
         """Return user name who uploaded the asset"""
         if obj.uploaded_by:
             return obj.uploaded_by.get_full_name() or obj.uploaded_by.email
         return None
-    
-    def get_file_size_formatted(self, obj):
-        """Return formatted file size (KB, MB, etc.)"""
-        size = obj.file_size
-        if size < 1024:
-            return f"{size} B"
-        elif size < 1024 * 1024:
-            return f"{size/1024:.1f} KB"
-        else:
-            return f"{size/(1024*1024):.1f} MB"
 
 class ProductEventSerializer(serializers.ModelSerializer):
     created_by_name = serializers.SerializerMethodField()
@@ -645,11 +949,228 @@ class AttributeSerializer(serializers.ModelSerializer):
         try:
             # Use the related_name "options" defined on the AttributeOption FK
             return AttributeOptionSerializer(obj.options.all(), many=True).data
-        except Exception as e:
-            print(f"ERROR: Failed to get options for attribute {obj.id}: {str(e)}")
+        except Exception:
+            logger.exception("Failed to get options for attribute %s", obj.id)
             return []
 
+# Per-data_type value validators for AttributeValueSerializer.validate. Each
+# takes the submitted value, the Attribute and the serializer context, and
+# returns the coerced value or raises serializers.ValidationError.
+
+def _is_currency_code(code):
+    return code in get_currencies()
+
+def _validate_number(value, attr, context):
+    # Keep the integer vs. float distinction: whole numbers are stored as
+    # int. JSON numbers arrive as int/float already; strings are parsed once
+    # as Decimal so large integers keep every digit.
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, float):
+        if math.isfinite(value):
+            return int(value) if value.is_integer() else value
+    elif isinstance(value, str):
+        try:
+            number = Decimal(value)
+        except InvalidOperation:
+            pass
+        else:
+            if number.is_finite():
+                return int(number) if number == number.to_integral_value() else float(number)
+    raise serializers.ValidationError({"value": f"Value must be a number for attribute '{attr.label}'"})
+
+_BOOLEAN_TRUE = frozenset({'true', 't', 'yes', 'y', '1'})
+_BOOLEAN_FALSE = frozenset({'false', 'f', 'no', 'n', '0'})
+
+def _validate_boolean(value, attr, context):
+    # Convert string representations to boolean; nothing longer than
+    # 'false' can match, so long strings are not lowercased
+    if isinstance(value, str):
+        key = value.lower() if len(value) <= 5 else None
+        if key in _BOOLEAN_TRUE:
+            return True
+        if key in _BOOLEAN_FALSE:
+            return False
+        raise serializers.ValidationError({"value": f"Invalid boolean value for attribute '{attr.label}'"})
+    return bool(value)
+
+def _validate_date(value, attr, context):
+    # Strictly enforce ISO-8601 (YYYY-MM-DD)
+    if not isinstance(value, str):
+        raise serializers.ValidationError(
+            {"value": f"Date must be a string in ISO-8601 format (YYYY-MM-DD) for attribute '{attr.label}'"}
+        )
+    match = ISO_DATE_PATTERN.match(value)
+    if not match:
+        raise serializers.ValidationError(
+            {"value": f"Date must be in ISO-8601 format (YYYY-MM-DD) for attribute '{attr.label}'. Got: '{value}'"}
+        )
+    # Build the date from the matched groups to reject values like
+    # 2024-02-30 or month 13
+    try:
+        datetime(int(match['year']), int(match['month']), int(match['day']))
+    except ValueError:
+        raise serializers.ValidationError(
+            {"value": f"Invalid date value for attribute '{attr.label}'. Must be a valid date in ISO-8601 format (YYYY-MM-DD)"}
+        )
+    return value
+
+def _validate_rich_text(value, attr, context):
+    # Sanitize the HTML with Bleach; empty strings have nothing to sanitize
+    if not isinstance(value, str):
+        raise serializers.ValidationError({"value": f"Rich text must be a string for attribute '{attr.label}'"})
+    return _cleaner().clean(value) if value else value
+
+def _validate_price(value, attr, context):
+    # Value must be a dict with amount (decimal) and currency (string)
+    if not isinstance(value, dict):
+        raise serializers.ValidationError({"value": f"Price must be an object with amount and currency for attribute '{attr.label}'"})
+    if 'amount' not in value or 'currency' not in value:
+        raise serializers.ValidationError({"value": f"Price must contain both amount and currency for attribute '{attr.label}'"})
+    # Amount must be a non-negative number (stored as float, frontend formats it)
+    try:
+        amount = float(value['amount'])
+    except (ValueError, TypeError):
+        raise serializers.ValidationError({"value": f"Price amount must be a number for attribute '{attr.label}'"})
+    if amount < 0:
+        raise serializers.ValidationError({"value": f"Price amount must be non-negative for attribute '{attr.label}'"})
+    value['amount'] = amount
+    # Currency must exist in the Currency table
+    currency_code = str(value['currency']).upper()
+    if not _is_currency_code(currency_code):
+        raise serializers.ValidationError({"value": f"Invalid currency code '{currency_code}' for attribute '{attr.label}'"})
+    value['currency'] = currency_code
+    return value
+
+def _validate_media(value, attr, context):
+    # Value must be a dict with an integer asset_id
+    if not isinstance(value, dict):
+        raise serializers.ValidationError({"value": f"Media value must be an object with asset_id for attribute '{attr.label}'"})
+    if 'asset_id' not in value:
+        raise serializers.ValidationError({"value": f"Media value must contain asset_id for attribute '{attr.label}'"})
+    try:
+        asset_id = int(value['asset_id'])
+    except (ValueError, TypeError):
+        raise serializers.ValidationError({"value": f"Media asset_id must be an integer for attribute '{attr.label}'"})
+    value['asset_id'] = asset_id
+    # The asset must exist and belong to the same organization. Callers
+    # validating many values can pass the org's asset ids up front as
+    # context['valid_asset_ids'].
+    valid_asset_ids = context.get('valid_asset_ids')
+    if valid_asset_ids is not None:
+        asset_exists = asset_id in valid_asset_ids
+    else:
+        org = _get_request_organization(context['request'])
+        asset_exists = ProductAsset.objects.filter(id=asset_id, organization=org).exists()
+    if not asset_exists:
+        raise serializers.ValidationError({"value": f"Asset with ID {asset_id} does not exist or doesn't belong to your organization"})
+    return value
+
+def _validate_measurement(value, attr, context):
+    # Value must be a dict with amount (decimal) and optional unit (string)
+    if not isinstance(value, dict):
+        raise serializers.ValidationError({"value": f"Measurement must be an object with amount and unit for attribute '{attr.label}'"})
+    if 'amount' not in value:
+        raise serializers.ValidationError({"value": f"Measurement must contain amount for attribute '{attr.label}'"})
+    try:
+        amount = float(value['amount'])
+    except (ValueError, TypeError):
+        raise serializers.ValidationError({"value": f"Measurement amount must be a number for attribute '{attr.label}'"})
+    if amount < 0:
+        raise serializers.ValidationError({"value": f"Measurement amount must be non-negative for attribute '{attr.label}'"})
+    value['amount'] = amount
+    # Validate the unit against context['allowed_units'] when provided
+    if value.get('unit'):
+        allowed_units = context.get('allowed_units')
+        if allowed_units and value['unit'] not in allowed_units:
+            raise serializers.ValidationError({"value": f"Invalid measurement unit '{value['unit']}'. Allowed units: {', '.join(allowed_units)}"})
+    return value
+
+def _validate_url(value, attr, context):
+    if not isinstance(value, str):
+        raise serializers.ValidationError({"value": f"URL must be a string for attribute '{attr.label}'"})
+    try:
+        _URL_VALIDATOR(value)
+    except DjangoValidationError:
+        raise serializers.ValidationError({"value": f"Invalid URL format for attribute '{attr.label}'"})
+    return value
+
+def _validate_email(value, attr, context):
+    if not isinstance(value, str):
+        raise serializers.ValidationError({"value": f"Email must be a string for attribute '{attr.label}'"})
+    try:
+        validate_email(value)
+    except DjangoValidationError:
+        raise serializers.ValidationError({"value": f"Invalid email format for attribute '{attr.label}'"})
+    return value
+
+def _validate_phone(value, attr, context):
+    if not isinstance(value, str):
+        raise serializers.ValidationError({"value": f"Phone number must be a string for attribute '{attr.label}'"})
+    try:
+        parsed_number = phonenumbers.parse(value, _PHONE_REGION)
+    except phonenumbers.NumberParseException:
+        raise serializers.ValidationError({"value": f"Could not parse phone number for attribute '{attr.label}'"})
+    if not phonenumbers.is_valid_number(parsed_number):
+        raise serializers.ValidationError({"value": f"Invalid phone number format for attribute '{attr.label}'"})
+    # Store in E.164 for standardization
+    return phonenumbers.format_number(parsed_number, phonenumbers.PhoneNumberFormat.E164)
+
+_VALUE_VALIDATORS = {
+    'number': _validate_number,
+    'boolean': _validate_boolean,
+    'date': _validate_date,
+    'rich_text': _validate_rich_text,
+    'price': _validate_price,
+    'media': _validate_media,
+    'measurement': _validate_measurement,
+    'url': _validate_url,
+    'email': _validate_email,
+    'phone': _validate_phone,
+}
+
+class AttributeValueListSerializer(serializers.ListSerializer):
+    """
+    Preloads what per-row validation of a bulk payload needs: the referenced
+    attributes and products are seeded into the _pk_cache used by the
+    related fields, and the submitted media asset ids are checked against
+    the organization in one query and passed on as valid_asset_ids.
+    """
+    preloaded_fields = (('attribute', Attribute), ('product', Product))
+
+    def to_internal_value(self, data):
+        if isinstance(data, list):
+            self._preload([row for row in data if isinstance(row, dict)])
+        return super().to_internal_value(data)
+
+    def _preload(self, rows):
+        cache = self.context.setdefault('_pk_cache', {})
+        for name, model in self.preloaded_fields:
+            pks = {str(row[name]) for row in rows if row.get(name) is not None}
+            pks = {pk for pk in pks if pk.isdigit() and (model._meta.label, pk) not in cache}
+            for obj in model._default_manager.in_bulk(pks).values():
+                cache[(model._meta.label, str(obj.pk))] = obj
+
+        request = self.context.get('request')
+        if request is None or 'valid_asset_ids' in self.context:
+            return
+        asset_ids = set()
+        for row in rows:
+            value = row.get('value')
+            if isinstance(value, dict) and str(value.get('asset_id', '')).isdigit():
+                asset_ids.add(int(value['asset_id']))
+        if asset_ids:
+            self.context['valid_asset_ids'] = set(
+                ProductAsset.objects.filter(
+                    organization=_get_request_organization(request), id__in=asset_ids
+                ).values_list('id', flat=True)
+            )
+
 class AttributeValueSerializer(serializers.ModelSerializer):
+    # Memoize related lookups per request; bulk payloads are preloaded by
+    # AttributeValueListSerializer
+    serializer_related_field = CachedPrimaryKeyRelatedField
+
     class Meta:
         model = AttributeValue
         fields = '__all__'
@@ -663,298 +1184,71 @@ class AttributeValueSerializer(serializers.ModelSerializer):
             # flat `/api/attributes/` endpoint.
             'product': {'read_only': False},
         }
+        list_serializer_class = AttributeValueListSerializer
 
     def validate(self, data):
-        print(f"AttributeValueSerializer.validate called with data: {data}")
-        print(f"Self instance: {getattr(self, 'instance', None)}")
-        print(f"Self context: {self.context}")
-        
         # Get the attribute from the context set in the view
         attr = getattr(self.instance, 'attribute', None)
         if not attr and 'attribute' in self.context:
             attr = self.context.get('attribute')
-            
-        print(f"Attribute from context or instance: {attr}")
+        # Bulk payloads carry the attribute on each row
+        if not attr and 'request' in self.context:
+            attr = data.get('attribute')
             
         # If we still don't have an attribute, skip validation
         if not attr:
-            print("WARNING: No attribute found in context or instance!")
+            logger.debug("AttributeValueSerializer.validate: no attribute in context or instance")
             return data
             
-        org = get_user_organization(self.context['request'].user)
+        org = _get_request_organization(self.context['request'])
         
-        # Debug log the incoming value
-        print(f"AttributeValueSerializer.validate: Validating value for attr {attr.id} ({attr.label}): {data.get('value')}, type: {type(data.get('value'))}")
+        # Debug log the incoming value (lazy formatting, skipped when DEBUG is off)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Validating value for attr %s (%s): %r", attr.id, attr.label, data.get('value'))
         
         # Check organization matches
         if attr.organization_id != org.id:
             raise serializers.ValidationError("Attribute belongs to a different organization")
         
         # Validate and coerce value based on attribute data_type
-        try:
-            value = data.get('value')
-            if attr.data_type == 'number':
-                # Ensure value is numeric
-                try:
-                    # Convert to float for validation, but use the raw value in the data
-                    # This preserves integers vs. floats distinction
-                    float_val = float(value)
-                    # If it's a whole number, convert to int
-                    if float_val.is_integer():
-                        data['value'] = int(float_val)
-                    else:
-                        data['value'] = float_val
-                    print(f"Converted number value: {data['value']} (type: {type(data['value'])})")
-                except (ValueError, TypeError):
-                    raise serializers.ValidationError({"value": f"Value must be a number for attribute '{attr.label}'"})
-            
-            elif attr.data_type == 'boolean':
-                # Convert string representations to boolean
-                if isinstance(value, str):
-                    if value.lower() in ('true', 't', 'yes', 'y', '1'):
-                        data['value'] = True
-                    elif value.lower() in ('false', 'f', 'no', 'n', '0'):
-                        data['value'] = False
-                    else:
-                        raise serializers.ValidationError({"value": f"Invalid boolean value for attribute '{attr.label}'"})
-                else:
-                    # Ensure it's a proper boolean
-                    data['value'] = bool(value)
-                print(f"Converted boolean value: {data['value']} (type: {type(data['value'])})")
-            
-            elif attr.data_type == 'date':
-                # Validate date format - strictly enforce ISO-8601 (YYYY-MM-DD)
-                from datetime import datetime
-                import re
-                
-                # ISO-8601 date format regex (YYYY-MM-DD)
-                iso_date_pattern = re.compile(r'^\d{4}-\d{2}-\d{2}$')
-                
-                if not isinstance(value, str):
-                    raise serializers.ValidationError(
-                        {"value": f"Date must be a string in ISO-8601 format (YYYY-MM-DD) for attribute '{attr.label}'"}
-                    )
-                
-                if not iso_date_pattern.match(value):
-                    raise serializers.ValidationError(
-                        {"value": f"Date must be in ISO-8601 format (YYYY-MM-DD) for attribute '{attr.label}'. Got: '{value}'"}
-                    )
-                
-                # Try parsing the date to validate it's a proper date
-                try:
-                    datetime.strptime(value, '%Y-%m-%d')
-                except ValueError:
-                    raise serializers.ValidationError(
-                        {"value": f"Invalid date value for attribute '{attr.label}'. Must be a valid date in ISO-8601 format (YYYY-MM-DD)"}
-                    )
-                print(f"Validated date value: {data['value']}")
-            
-            elif attr.data_type == 'rich_text':
-                # Validate rich text (HTML) and sanitize it with Bleach
-                import bleach
-                
-                if not isinstance(value, str):
-                    raise serializers.ValidationError({"value": f"Rich text must be a string for attribute '{attr.label}'"})
-                
-                # Define allowed tags and attributes for sanitization
-                allowed_tags = [
-                    'a', 'abbr', 'acronym', 'b', 'blockquote', 'code', 'em', 'i', 'li', 'ol', 'p',
-                    'strong', 'ul', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'span', 'br', 'hr'
-                ]
-                allowed_attrs = {
-                    'a': ['href', 'title', 'target'],
-                    'abbr': ['title'],
-                    'acronym': ['title'],
-                    'span': ['style'],
-                }
-                
-                # Sanitize the HTML
-                sanitized_value = bleach.clean(value, tags=allowed_tags, attributes=allowed_attrs)
-                data['value'] = sanitized_value
-                print(f"Sanitized rich text value: {data['value']}")
-            
-            elif attr.data_type == 'price':
-                # Value must be a dict with amount (decimal) and currency (string)
-                if not isinstance(value, dict):
-                    raise serializers.ValidationError({"value": f"Price must be an object with amount and currency for attribute '{attr.label}'"})
-                
-                # Check required keys
-                if 'amount' not in value or 'currency' not in value:
-                    raise serializers.ValidationError({"value": f"Price must contain both amount and currency for attribute '{attr.label}'"})
-                
-                # Validate amount (must be a non-negative decimal)
-                try:
-                    amount = float(value['amount'])
-                    if amount < 0:
-                        raise serializers.ValidationError({"value": f"Price amount must be non-negative for attribute '{attr.label}'"})
-                    # Store as float (frontend will format)
-                    value['amount'] = amount
-                except (ValueError, TypeError):
-                    raise serializers.ValidationError({"value": f"Price amount must be a number for attribute '{attr.label}'"})
-                
-                # Validate currency (must exist in Currency table)
-                from prices.models import Currency
-                currency_code = str(value['currency']).upper()
-                if not Currency.objects.filter(iso_code=currency_code).exists():
-                    raise serializers.ValidationError({"value": f"Invalid currency code '{currency_code}' for attribute '{attr.label}'"})
-                
-                value['currency'] = currency_code
-                data['value'] = value
-                print(f"Validated price value: {data['value']}")
-            
-            elif attr.data_type == 'media':
-                # Value must be a dict with asset_id (int)
-                if not isinstance(value, dict):
-                    raise serializers.ValidationError({"value": f"Media value must be an object with asset_id for attribute '{attr.label}'"})
-                
-                # Check required keys
-                if 'asset_id' not in value:
-                    raise serializers.ValidationError({"value": f"Media value must contain asset_id for attribute '{attr.label}'"})
-                
-                # Validate asset_id (must be an integer and exist in Asset table)
-                try:
-                    asset_id = int(value['asset_id'])
-                    value['asset_id'] = asset_id
-                except (ValueError, TypeError):
-                    raise serializers.ValidationError({"value": f"Media asset_id must be an integer for attribute '{attr.label}'"})
-                
-                # Check if asset exists and belongs to the same organization
-                from .models import ProductAsset
-                if not ProductAsset.objects.filter(id=asset_id, organization=org).exists():
-                    raise serializers.ValidationError({"value": f"Asset with ID {asset_id} does not exist or doesn't belong to your organization"})
-                
-                data['value'] = value
-                print(f"Validated media value: {data['value']}")
-            
-            elif attr.data_type == 'measurement':
-                # Value must be a dict with amount (decimal) and unit (string)
-                if not isinstance(value, dict):
-                    raise serializers.ValidationError({"value": f"Measurement must be an object with amount and unit for attribute '{attr.label}'"})
-                
-                # Check required keys
-                if 'amount' not in value:
-                    raise serializers.ValidationError({"value": f"Measurement must contain amount for attribute '{attr.label}'"})
-                
-                # Validate amount (must be a non-negative decimal)
-                try:
-                    amount = float(value['amount'])
-                    if amount < 0:
-                        raise serializers.ValidationError({"value": f"Measurement amount must be non-negative for attribute '{attr.label}'"})
-                    value['amount'] = amount
-                except (ValueError, TypeError):
-                    raise serializers.ValidationError({"value": f"Measurement amount must be a number for attribute '{attr.label}'"})
-                
-                # Validate unit if present
-                if 'unit' in value and value['unit']:
-                    # If allowedUnits exists in the context or somewhere else, validate against it
-                    allowed_units = self.context.get('allowed_units', None)
-                    if allowed_units and value['unit'] not in allowed_units:
-                        raise serializers.ValidationError({"value": f"Invalid measurement unit '{value['unit']}'. Allowed units: {', '.join(allowed_units)}"})
-                
-                data['value'] = value
-                print(f"Validated measurement value: {data['value']}")
-            
-            elif attr.data_type == 'url':
-                # Validate URL format
-                from django.core.validators import URLValidator
-                from django.core.exceptions import ValidationError as DjangoValidationError
-                
-                if not isinstance(value, str):
-                    raise serializers.ValidationError({"value": f"URL must be a string for attribute '{attr.label}'"})
-                
-                # Validate URL
-                url_validator = URLValidator()
-                try:
-                    url_validator(value)
-                except DjangoValidationError:
-                    raise serializers.ValidationError({"value": f"Invalid URL format for attribute '{attr.label}'"})
-                
-                data['value'] = value
-                print(f"Validated URL value: {data['value']}")
-            
-            elif attr.data_type == 'email':
-                # Validate email format
-                from django.core.validators import validate_email
-                from django.core.exceptions import ValidationError as DjangoValidationError
-                
-                if not isinstance(value, str):
-                    raise serializers.ValidationError({"value": f"Email must be a string for attribute '{attr.label}'"})
-                
-                # Validate email
-                try:
-                    validate_email(value)
-                except DjangoValidationError:
-                    raise serializers.ValidationError({"value": f"Invalid email format for attribute '{attr.label}'"})
-                
-                data['value'] = value
-                print(f"Validated email value: {data['value']}")
-            
-            elif attr.data_type == 'phone':
-                # Validate phone number
-                import phonenumbers
-                
-                if not isinstance(value, str):
-                    raise serializers.ValidationError({"value": f"Phone number must be a string for attribute '{attr.label}'"})
-                
-                # Default region (can be configurable)
-                default_region = 'US'
-                
-                try:
-                    # Parse phone number
-                    parsed_number = phonenumbers.parse(value, default_region)
-                    
-                    # Check if it's a valid number
-                    if not phonenumbers.is_valid_number(parsed_number):
-                        raise serializers.ValidationError({"value": f"Invalid phone number format for attribute '{attr.label}'"})
-                    
-                    # Format to E.164 (optional, for standardization)
-                    data['value'] = phonenumbers.format_number(parsed_number, phonenumbers.PhoneNumberFormat.E164)
-                except phonenumbers.NumberParseException:
-                    raise serializers.ValidationError({"value": f"Could not parse phone number for attribute '{attr.label}'"})
-                
-                print(f"Validated phone value: {data['value']}")
-            
-        except Exception as e:
-            if not isinstance(e, serializers.ValidationError):
+        validator = _VALUE_VALIDATORS.get(attr.data_type)
+        # An update that resubmits the stored value for the same attribute,
+        # locale and channel was validated when it was saved; skip the checks
+        # and keep the stored (already coerced) form
+        if self.instance is not None and 'value' in data and data['value'] == self.instance.value and all(
+            getattr(new, 'pk', new) == self.instance.serializable_value(key)
+            for key, new in data.items() if key != 'value'
+        ):
+            data['value'] = self.instance.value
+            validator = None
+        if validator is not None:
+            try:
+                data['value'] = validator(data.get('value'), attr, self.context)
+            except serializers.ValidationError:
+                raise
+            except Exception as e:
                 raise serializers.ValidationError({"value": f"Error validating value: {str(e)}"})
-            raise
             
         # If attribute not in data, add it
         if 'attribute' not in data and attr:
-            print(f"Adding attribute {attr.id} to validated data")
             data['attribute'] = attr
             
         return data
         
     def create(self, validated_data):
-        print(f"AttributeValueSerializer.create: Creating with data: {validated_data}")
-        print(f"Attribute in data: {validated_data.get('attribute', 'Not found')}")
-        print(f"Product in data: {validated_data.get('product', 'Not found')}")
-        print(f"Organization in data: {validated_data.get('organization', 'Not found')}")
-        print(f"Created by in data: {validated_data.get('created_by', 'Not found')}")
-        
         # Ensure attribute is present
         if 'attribute' not in validated_data:
-            print("ERROR: attribute not in validated_data!")
             if 'attribute' in self.context:
-                print(f"Adding attribute from context: {self.context['attribute'].id}")
                 validated_data['attribute'] = self.context['attribute']
                 
-        instance = super().create(validated_data)
-        print(f"Created attribute value: {instance.id}, value: {instance.value}, type: {type(instance.value)}")
-        return instance
-        
-    def update(self, instance, validated_data):
-        print(f"AttributeValueSerializer.update: Updating with data: {validated_data}")
-        instance = super().update(instance, validated_data)
-        print(f"Updated attribute value: {instance.id}, value: {instance.value}, type: {type(instance.value)}")
-        return instance
+        return super().create(validated_data)
 
 # Add the missing AttributeValueDetailSerializer
-class AttributeValueDetailSerializer(AttributeValueSerializer):
+class AttributeValueDetailSerializer(CachedRepresentationMixin, AttributeValueSerializer):
     """
     Serializer for attribute values with more detailed attribute information.
-    Used for list and retrieve actions.
+    Used for list and retrieve actions; rows repeated within one response
+    are rendered once.
     """
     attribute_code = serializers.CharField(source='attribute.code', read_only=True)
     attribute_label = serializers.CharField(source='attribute.label', read_only=True)
@@ -965,11 +1259,28 @@ class AttributeValueDetailSerializer(AttributeValueSerializer):
         fields = ('id', 'attribute', 'product', 'organization', 'value', 'locale', 'channel',
                 'attribute_code', 'attribute_label', 'attribute_type')
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the attribute and load only the columns this serializer renders"""
+        return queryset.select_related('attribute').only(
+            'id', 'attribute_id', 'product_id', 'organization_id', 'value', 'locale_id', 'channel',
+            'attribute__code', 'attribute__label', 'attribute__data_type'
+        )
+
 class AttributeGroupItemSerializer(serializers.ModelSerializer):
     class Meta:
         model = AttributeGroupItem
         fields = ('id', 'attribute', 'order')
 
+class _AttributeGroupItemWriteSerializer(serializers.Serializer):
+    """
+    Slim write shape for nested group items: plain integers, no per-item
+    model lookups. Renders the same keys as AttributeGroupItemSerializer.
+    """
+    id = serializers.IntegerField(required=False)
+    attribute = serializers.IntegerField(source='attribute_id', required=False)
+    order = serializers.IntegerField(required=False, min_value=0)
+
 class AttributeGroupSerializer(serializers.ModelSerializer):
     items = AttributeGroupItemSerializer(source='attributegroupitem_set',
                                          many=True, required=False)
@@ -978,31 +1289,85 @@ class AttributeGroupSerializer(serializers.ModelSerializer):
         fields = ('id', 'name', 'order', 'items')
         read_only_fields = ('id',)
 
+    def get_fields(self):
+        fields = super().get_fields()
+        # Writes only need ids and orders; attributes are resolved in bulk in create()
+        if hasattr(self, 'initial_data'):
+            fields['items'] = _AttributeGroupItemWriteSerializer(
+                source='attributegroupitem_set', many=True, required=False
+            )
+        return fields
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Prefetch the nested items so serializing N groups costs two queries"""
+        return queryset.prefetch_related(
+            Prefetch(
+                'attributegroupitem_set',
+                queryset=AttributeGroupItem.objects.only(
+                    'id', 'group_id', 'attribute_id', 'order'
+                ).order_by('group_id', 'order')
+            )
+        )
+
+    @transaction.atomic
     def create(self, validated_data):
-        items_data = validated_data.pop('attributegroupitem_set', [])
+        items_data = validated_data.pop('attributegroupitem_set', None) or []
         
         # Create the group first without items
-        group = AttributeGroup.objects.create(**validated_data)
+        group = AttributeGroup(**validated_data)
+        group.save(force_insert=True)
+        
+        # Items without an id are new rows: insert them in one statement,
+        # skipping repeated attributes like the add-item endpoint does
+        new_payloads = [
+            (position, payload) for position, payload in enumerate(items_data)
+            if not payload.get('id')
+        ]
+        if any(payload.get('attribute_id') is None for _, payload in new_payloads):
+            raise serializers.ValidationError({'items': "New items require an attribute."})
+        attributes = Attribute.objects.filter(
+            organization_id=group.organization_id,
+            pk__in=[payload['attribute_id'] for _, payload in new_payloads]
+        ).only('id').in_bulk()
+        new_items = []
+        seen_attribute_ids = set()
+        for position, payload in new_payloads:
+            attribute_id = payload['attribute_id']
+            if attribute_id not in attributes:
+                raise serializers.ValidationError(
+                    {'items': f"Attribute {attribute_id} does not belong to this organization."}
+                )
+            if attribute_id in seen_attribute_ids:
+                continue
+            seen_attribute_ids.add(attribute_id)
+            new_items.append(AttributeGroupItem(
+                group=group,
+                attribute_id=attribute_id,
+                order=payload.get('order', position)
+            ))
+        if new_items:
+            AttributeGroupItem.objects.bulk_create(new_items, batch_size=500)
         
-        # Add items if any
+        # Reorder any existing items referenced by id
         if items_data:
             self._sync_items(group, items_data)
             
         return group
 
     def update(self, instance, validated_data):
-        items_data = validated_data.pop('attributegroupitem_set', None)
-        
         # Check if attempting to update items through PATCH
-        if items_data is not None:
+        if 'attributegroupitem_set' in validated_data:
             raise serializers.ValidationError(
                 "Use POST /api/attribute-groups/<id>/items/ to add or DELETE /api/attribute-groups/<id>/items/<item_id>/ to remove"
             )
         
-        # Update basic fields
-        for k, v in validated_data.items():
-            setattr(instance, k, v)
-        instance.save()
+        # Write only the submitted columns in one UPDATE (AttributeGroup has
+        # no save() logic or signals), then mirror them onto the instance
+        if validated_data:
+            AttributeGroup.objects.filter(pk=instance.pk).update(**validated_data)
+            for k, v in validated_data.items():
+                setattr(instance, k, v)
         
         return instance
 
@@ -1011,19 +1376,46 @@ class AttributeGroupSerializer(serializers.ModelSerializer):
         Only order-update existing items – creation / deletion are now handled by viewset.
         """
         if not items_data:
-            print("No items data provided")
             return
-            
-        print(f"Syncing items for group {group.id}: {len(items_data)} items")
+
+        logger.debug("Syncing items for group %s: %d items", group.id, len(items_data))
         
-        # Create id to item mapping 
-        id_map = {i.get('id'): i for i in items_data if i.get('id')}
+        # (item id, new order) in payload order; the default order is the
+        # item's position in the submitted list
+        updates = []
+        seen_ids = set()
+        for position, payload in enumerate(items_data):
+            item_id = payload.get('id')
+            if not item_id:
+                continue
+            # A repeated id has no single target order; reject it rather
+            # than letting the last occurrence win
+            if item_id in seen_ids:
+                raise serializers.ValidationError({'items': f"Item {item_id} is listed more than once."})
+            seen_ids.add(item_id)
+            updates.append((item_id, payload.get('order', position)))
+        if not updates:
+            return
         
-        # Update order of existing items
-        for position, (item_id, payload) in enumerate(id_map.items()):
-            AttributeGroupItem.objects.filter(id=item_id, group=group).update(
-                order=payload.get('order', position)
-            ) 
+        # Update order of existing items with a single multi-row UPDATE;
+        # atomic so the read and write commit together (a savepoint under create)
+        with transaction.atomic():
+            stored = dict(
+                AttributeGroupItem.objects.filter(
+                    group=group, id__in=[item_id for item_id, _ in updates]
+                ).values_list('id', 'order')
+            )
+            desired = {item_id: order for item_id, order in updates if item_id in stored}
+            # Only write rows whose order actually changed; none means no UPDATE
+            changed = {pk: order for pk, order in desired.items() if order != stored[pk]}
+            if changed:
+                AttributeGroupItem.objects.filter(group=group, id__in=list(changed)).update(
+                    order=Case(
+                        *[When(id=pk, then=Value(order)) for pk, order in changed.items()],
+                        default=F('order'),
+                        output_field=models.PositiveSmallIntegerField()
+                    )
+                )
 
 # Serializer for AttributeOption
 class AttributeOptionSerializer(serializers.ModelSerializer):
@@ -1048,10 +1440,8 @@ class FamilyAttributeGroupSerializer(serializers.ModelSerializer):
         read_only_fields = ['id']
 
     def validate(self, data):
-        from kernlogic.utils import get_user_organization
-        
         # Use get_user_organization instead of directly accessing user.organization
-        org = get_user_organization(self.context['request'].user) if 'request' in self.context else None
+        org = _get_request_organization(self.context['request']) if 'request' in self.context else None
         if org and data['attribute_group'].organization != org:
             raise serializers.ValidationError('Attribute group must belong to your organization.')
         return data
@@ -1068,7 +1458,7 @@ class FamilySerializer(serializers.ModelSerializer):
         
     def validate_code(self, value):
         """Ensure code is unique within the organization"""
-        org = get_user_organization(self.context['request'].user) if 'request' in self.context else None
+        org = _get_request_organization(self.context['request']) if 'request' in self.context else None
         qs = Family.objects.filter(code=value)
         if org:
             qs = qs.filter(organization=org)
@@ -1089,22 +1479,18 @@ class FamilySerializer(serializers.ModelSerializer):
         create_kwargs = {**validated_data}
         
         if 'organization' not in validated_data and request:
-            create_kwargs['organization'] = get_user_organization(request.user)
+            create_kwargs['organization'] = _get_request_organization(request)
             
         if 'created_by' not in validated_data and request:
             create_kwargs['created_by'] = request.user
             
         # Create the family
-        family = Family.objects.create(**create_kwargs)
+        family = self._save_guarding_code(Family(**create_kwargs))
         
-        # Create attribute group associations
+        # Create attribute group associations in one INSERT
         organization = create_kwargs.get('organization')
-        for group_data in attribute_groups_data:
-            FamilyAttributeGroup.objects.create(
-                family=family,
-                organization=organization,
-                **group_data
-            )
+        links = self._attribute_group_links(family, organization, attribute_groups_data)
+        FamilyAttributeGroup.objects.bulk_create(links.values())
             
         return family
         
@@ -1115,22 +1501,64 @@ class FamilySerializer(serializers.ModelSerializer):
         # Update family fields
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
-        instance.save()
+        self._save_guarding_code(instance)
         
-        # Update attribute groups if provided
+        # Update attribute groups if provided: diff the stored links against
+        # the payload by attribute group so unchanged rows are left alone
         if attribute_groups_data is not None:
-            # Clear existing attribute groups
-            instance.attribute_groups.all().delete()
+            incoming = self._attribute_group_links(instance, instance.organization, attribute_groups_data)
+            existing = {link.attribute_group_id: link for link in instance.attribute_groups.all()}
             
-            # Create new attribute groups
-            for group_data in attribute_groups_data:
-                FamilyAttributeGroup.objects.create(
-                    family=instance,
-                    organization=instance.organization,
-                    **group_data
-                )
+            removed = existing.keys() - incoming.keys()
+            if removed:
+                instance.attribute_groups.filter(attribute_group_id__in=removed).delete()
+            
+            added = [link for group_id, link in incoming.items() if group_id not in existing]
+            if added:
+                FamilyAttributeGroup.objects.bulk_create(added)
+            
+            changed = []
+            for group_id in existing.keys() & incoming.keys():
+                link, new = existing[group_id], incoming[group_id]
+                if (link.required, link.order, link.organization_id) != (new.required, new.order, new.organization_id):
+                    link.required, link.order, link.organization_id = new.required, new.order, new.organization_id
+                    changed.append(link)
+            if changed:
+                FamilyAttributeGroup.objects.bulk_update(changed, ['required', 'order', 'organization'])
                 
-        return instance 
+        return instance
+
+    @staticmethod
+    def _save_guarding_code(family):
+        """
+        Save the family inside a savepoint and turn a violation of the
+        (code, organization) unique constraint, e.g. from a concurrent
+        request that passed validate_code too, into the same error.
+        """
+        try:
+            with transaction.atomic():
+                family.save()
+        except IntegrityError:
+            duplicates = Family.objects.filter(code=family.code, organization_id=family.organization_id)
+            if family.pk is not None:
+                duplicates = duplicates.exclude(pk=family.pk)
+            if not duplicates.exists():
+                raise
+            raise serializers.ValidationError({'code': ['Family code must be unique within your organization.']})
+        return family
+
+    @staticmethod
+    def _attribute_group_links(family, organization, attribute_groups_data):
+        """Unsaved FamilyAttributeGroup rows for the payload, keyed by attribute group id"""
+        links = {}
+        for group_data in attribute_groups_data:
+            link = FamilyAttributeGroup(family=family, organization=organization, **group_data)
+            if link.attribute_group_id in links:
+                raise serializers.ValidationError(
+                    {'attribute_groups': f"Attribute group {link.attribute_group_id} is listed more than once."}
+                )
+            links[link.attribute_group_id] = link
+        return links 
 
 class LocaleSerializer(serializers.ModelSerializer):
     """
@@ -1141,6 +1569,23 @@ class LocaleSerializer(serializers.ModelSerializer):
         fields = ['id', 'code', 'label', 'is_active']
         read_only_fields = ['id'] 
 
+class ProductPathListSerializer(serializers.ListSerializer):
+    """
+    List serializer for ProductListSerializer that loads the ancestors of
+    every category on the page with one query and caches the breadcrumbs.
+    """
+    def to_representation(self, data):
+        items = list(data.all() if isinstance(data, models.Manager) else data)
+        cache = self.context.setdefault('_category_path_cache', {})
+        categories = {
+            p.category_id: p.category if Product.category.is_cached(p) else None
+            for p in items if p.category_id and p.category_id not in cache
+        }
+        if categories:
+            for category_id, chain in _ancestor_chains(categories).items():
+                cache[category_id] = ' > '.join(node['name'] for node in chain)
+        return super().to_representation(items)
+
 class ProductListSerializer(serializers.ModelSerializer):
     """
     Enhanced serializer for Product model list view.
@@ -1152,29 +1597,43 @@ class ProductListSerializer(serializers.ModelSerializer):
     stock = serializers.SerializerMethodField()
     completeness_percent = serializers.SerializerMethodField()
     tags = serializers.SerializerMethodField()
-    family_name = serializers.SerializerMethodField()
-    updated_at = serializers.SerializerMethodField()
+    family_name = serializers.CharField(source='family.label', read_only=True, default=None)
     
     class Meta:
         model = Product
         fields = [
             'id', 'name', 'sku', 'price', 'is_active', 
             'primary_asset_url', 'category_name', 'created_at',
-            'description', 'brand', 'barcode', 'tags',
+            'brand', 'barcode', 'tags',
             'stock', 'completeness_percent', 'is_archived',
             'updated_at', 'family_name'
         ]
+        list_serializer_class = ProductPathListSerializer
     
+    @staticmethod
+    def _primary_asset(obj):
+        """
+        Primary asset, or the first image asset when none is primary.
+        Read from the ``primary_assets`` prefetch when the view supplied it,
+        otherwise from the assets prefetch cache, and memoized on the instance.
+        """
+        if not hasattr(obj, '_primary_asset'):
+            candidates = getattr(obj, 'primary_assets', None)
+            if candidates is None:
+                assets = list(obj.assets.all())
+                candidates = (
+                    [asset for asset in assets if asset.is_primary]
+                    or [asset for asset in assets if 'image' in (asset.asset_type or '').lower()]
+                )
+            obj._primary_asset = candidates[0] if candidates else None
+        return obj._primary_asset
+
     def get_primary_asset_url(self, obj):
         """Return the URL of the primary asset if it exists"""
         try:
-            primary_asset = obj.assets.filter(is_primary=True).first()
-            if primary_asset:
-                return primary_asset.file.url if primary_asset.file else None
-            # Fallback to first image asset if no primary is set
-            first_image = obj.assets.filter(asset_type__icontains='image').first()
-            if first_image:
-                return first_image.file.url if first_image.file else None
+            primary_asset = self._primary_asset(obj)
+            if primary_asset and primary_asset.file:
+                return primary_asset.file.url
             return None
         except Exception:
             return None
@@ -1184,11 +1643,15 @@ class ProductListSerializer(serializers.ModelSerializer):
         if not obj.category:
             return None
         
-        # Get all ancestors including self, ordered from root to leaf
-        ancestors = obj.category.get_ancestors(include_self=True)
-        
-        # Create a breadcrumb path from all category names
-        return ' > '.join([ancestor.name for ancestor in ancestors])
+        # Filled for the whole page by ProductPathListSerializer
+        cache = self.context.setdefault('_category_path_cache', {})
+        if obj.category_id not in cache:
+            # Get all ancestors including self, ordered from root to leaf
+            ancestors = obj.category.get_ancestors(include_self=True)
+            
+            # Create a breadcrumb path from all category names
+            cache[obj.category_id] = ' > '.join([ancestor.name for ancestor in ancestors])
+        return cache[obj.category_id]
     
     def get_price(self, obj):
         """Return the product's primary price"""
@@ -1218,11 +1681,17 @@ class ProductListSerializer(serializers.ModelSerializer):
             # This could be computed on-the-fly or from a cached value
             # Simple implementation for now
             required_fields = ['name', 'sku', 'description', 'price', 'category']
-            filled_fields = sum(1 for field in required_fields if getattr(obj, field, None))
+            filled_fields = sum(1 for field in required_fields if self._has_value(obj, field))
             return int((filled_fields / len(required_fields)) * 100)
         except Exception:
             return 0
             
+    def _has_value(self, obj, field):
+        # The list queryset defers description and annotates has_description
+        if field == 'description' and 'description' in obj.get_deferred_fields():
+            return getattr(obj, 'has_description', False)
+        return bool(getattr(obj, field, None))
+
     def get_tags(self, obj):
         """Return the product's tags"""
         try:
@@ -1230,8 +1699,8 @@ class ProductListSerializer(serializers.ModelSerializer):
             if obj.tags:
                 if isinstance(obj.tags, str):
                     try:
-                        return json.loads(obj.tags)
-                    except json.JSONDecodeError:
+                        return orjson.loads(obj.tags)
+                    except orjson.JSONDecodeError:
                         # If invalid JSON, return as a single item list
                         return [obj.tags]
                 elif isinstance(obj.tags, list):
@@ -1239,16 +1708,50 @@ class ProductListSerializer(serializers.ModelSerializer):
             return []
         except Exception:
             return []
-            
-    def get_family_name(self, obj):
-        """Return the name of the product's family if it exists"""
+
+# Columns read by FastProductListSerializer; used as ``.values(*FAST_PRODUCT_LIST_VALUES)``
+FAST_PRODUCT_LIST_VALUES = (
+    'id', 'name', 'sku', 'description', 'brand', 'barcode', 'is_active',
+    'is_archived', 'tags', 'category_id', 'family_id', 'primary_asset_file',
+    'created_at', 'updated_at',
+)
+
+class FastProductListSerializer(serializers.Serializer):
+    """
+    Fast-path serializer for product list responses.
+    Consumes plain dicts from ``.values(*FAST_PRODUCT_LIST_VALUES)`` instead of
+    model instances, so no ORM objects or related managers are touched.
+    The primary asset path must be annotated onto the queryset as ``primary_asset_file``.
+    """
+    id = serializers.IntegerField(read_only=True)
+    name = serializers.CharField(read_only=True)
+    sku = serializers.CharField(read_only=True)
+    description = serializers.CharField(read_only=True, allow_null=True)
+    brand = serializers.CharField(read_only=True, allow_null=True)
+    barcode = serializers.CharField(read_only=True, allow_null=True)
+    is_active = serializers.BooleanField(read_only=True)
+    is_archived = serializers.BooleanField(read_only=True)
+    tags = serializers.SerializerMethodField()
+    category_id = serializers.IntegerField(read_only=True, allow_null=True)
+    family_id = serializers.IntegerField(read_only=True, allow_null=True)
+    primary_asset_url = serializers.SerializerMethodField()
+    created_at = serializers.DateTimeField(read_only=True)
+    updated_at = serializers.DateTimeField(read_only=True)
+
+    def get_tags(self, row):
+        """Return the tags column decoded to a list"""
+        tags = row.get('tags')
+        if not tags:
+            return []
         try:
-            if obj.family:
-                return obj.family.label
-            return None
-        except Exception:
+            parsed = orjson.loads(tags)
+        except orjson.JSONDecodeError:
+            return [tags]
+        return parsed if isinstance(parsed, list) else [parsed]
+
+    def get_primary_asset_url(self, row):
+        """Return the storage URL for the annotated primary asset path"""
+        name = row.get('primary_asset_file')
+        if not name:
             return None
-            
-    def get_updated_at(self, obj):
-        """Return the product's updated_at timestamp"""
-        return obj.updated_at 
\ No newline at end of file
+        return default_storage.url(name)
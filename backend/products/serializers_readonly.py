@@ -17,7 +17,8 @@ class ProductAttributeValueSerializer(serializers.Serializer):
 class ProductActivitySerializer(serializers.ModelSerializer):
     # Reuse the existing Activity model and adapt it
     type = serializers.CharField(source='action')
-    user = serializers.CharField(source='user.username')
+    # Annotated by ActivityViewSet.get_queryset; None for system activity
+    user = serializers.CharField(source='user_username', read_only=True)
     timestamp = serializers.DateTimeField(source='created_at')
     details = serializers.CharField(source='message')
     
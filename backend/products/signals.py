@@ -1,5 +1,7 @@
 import sys
-from django.db.models.signals import post_save, post_delete, pre_save
+import threading
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, pre_save, pre_delete
 
 # Create placeholder classes for migrations
 if 'makemigrations' in sys.argv or 'migrate' in sys.argv:
@@ -9,23 +11,53 @@ if 'makemigrations' in sys.argv or 'migrate' in sys.argv:
         objects = None
     # No need to connect signals during migrations
 else:
-    from .models import Product, Activity
+    from .models import Product, Activity, Attribute, AttributeValue, Category
     from django.dispatch import receiver
     from .events import record
+    from prices.models import Currency
 
-    @receiver(post_save, sender=Product)
+    _activity_batches = threading.local()
+
+    class _ActivityBatch:
+        """Activity rows waiting for the current transaction to commit"""
+        def __init__(self):
+            self.rows = []
+
+        def flush(self):
+            if getattr(_activity_batches, 'batch', None) is self:
+                _activity_batches.batch = None
+            Activity.objects.bulk_create(self.rows)
+
+    def queue_activity(activity):
+        """
+        Save an Activity row when the current transaction commits, so rows
+        logged by many saves in one transaction go out in one INSERT.
+        Outside a transaction the row is saved immediately.
+        """
+        connection = transaction.get_connection()
+        if not connection.in_atomic_block:
+            activity.save()
+            return
+        batch = getattr(_activity_batches, 'batch', None)
+        # A rollback discards the batch's on_commit flush; start a new one
+        if batch is None or not any(callback == batch.flush for _, callback, _ in connection.run_on_commit):
+            batch = _activity_batches.batch = _ActivityBatch()
+            transaction.on_commit(batch.flush)
+        batch.rows.append(activity)
+
+    @receiver(post_save, sender=Product, dispatch_uid='products.product_saved')
     def product_saved(sender, instance, created, **kwargs):
         """Log when a product is created or updated"""
         if created:
             # Create an Activity record for product creation
-            Activity.objects.create(
+            queue_activity(Activity(
                 organization=instance.organization,
                 user=instance.created_by,
                 entity='product',
                 entity_id=instance.id,
                 action='create',
                 message=f"Created product '{instance.name}'"
-            )
+            ))
             
             # Record product creation event
             record(
@@ -33,9 +65,42 @@ else:
                 user=instance.created_by,
                 event_type="created",
                 summary=f"Product '{instance.name}' was created",
-                payload=None
+                payload={"product_id": instance.id, "sku": instance.sku, "name": instance.name}
             )
 
+    @receiver(post_save, sender=AttributeValue, dispatch_uid='products.attribute_value_changed')
+    @receiver(post_delete, sender=AttributeValue, dispatch_uid='products.attribute_value_changed')
+    def attribute_value_changed(sender, instance, **kwargs):
+        """Mark the product's completeness cache stale; it is recomputed on next read"""
+        Product.objects.filter(pk=instance.product_id).update(
+            completeness_cache=None,
+            missing_fields_cache=None
+        )
+
+    @receiver(post_save, sender=Attribute, dispatch_uid='products.attribute_changed')
+    @receiver(post_delete, sender=Attribute, dispatch_uid='products.attribute_changed')
+    def attribute_changed(sender, instance, **kwargs):
+        """Attribute definitions feed every product's completeness in the organization"""
+        Product.objects.filter(organization_id=instance.organization_id).update(
+            completeness_cache=None,
+            missing_fields_cache=None
+        )
+
+    @receiver(pre_delete, sender=Category, dispatch_uid='products.category_deleted')
+    def category_deleted(sender, instance, **kwargs):
+        """Product.category is SET_NULL without save(), so mark those products stale"""
+        Product.objects.filter(category=instance).update(
+            completeness_cache=None,
+            missing_fields_cache=None
+        )
+
+    @receiver(post_save, sender=Currency, dispatch_uid='products.currency_changed')
+    @receiver(post_delete, sender=Currency, dispatch_uid='products.currency_changed')
+    def currency_changed(sender, instance, **kwargs):
+        """Drop the currencies cached for price and attribute value validation"""
+        from prices.serializers import invalidate_currency_codes
+        invalidate_currency_codes()
+
     # Uncomment for additional signal handlers
     """
     @receiver(pre_save, sender=Product)
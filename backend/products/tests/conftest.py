@@ -0,0 +1,52 @@
+"""Shared pytest fixtures for the products test suite."""
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import transaction
+
+from organizations.models import Organization
+
+User = get_user_model()
+
+
+# Session fixtures commit their rows outside the per-test transaction, so
+# they use names no other test creates, get_or_create to survive an aborted
+# run with --reuse-db, and delete the rows again at teardown.
+
+@pytest.fixture(scope='session')
+def shared_org(django_db_setup, django_db_blocker):
+    """Organization provisioned once per test session."""
+    with django_db_blocker.unblock():
+        org, _ = Organization.objects.get_or_create(
+            name='Products Session Organization',
+            defaults={'default_locale': ''}
+        )
+    yield org
+    with django_db_blocker.unblock():
+        org.delete()
+
+
+@pytest.fixture(scope='session')
+def shared_user(django_db_setup, django_db_blocker):
+    """User provisioned once per test session."""
+    with django_db_blocker.unblock():
+        user = User.objects.filter(email='products-session@example.com').first()
+        if user is None:
+            user = User.objects.create_user(
+                username='products-session-user',
+                email='products-session@example.com',
+                password='testpassword123'
+            )
+    yield user
+    with django_db_blocker.unblock():
+        user.delete()
+
+
+@pytest.fixture
+def org(shared_org, db):
+    """
+    shared_org for a single test. The test's writes run in a savepoint
+    that is rolled back afterwards, so the shared rows stay untouched.
+    """
+    with transaction.atomic():
+        yield shared_org
+        transaction.set_rollback(True)
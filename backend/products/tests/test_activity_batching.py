@@ -0,0 +1,44 @@
+from django.db import connection, transaction
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from organizations.models import Organization
+from products.models import Activity, Product
+
+
+class ProductActivityBatchingTests(TestCase):
+    """
+    Test that product creation Activity rows are written when the
+    transaction commits, in one INSERT per transaction.
+    """
+
+    def setUp(self):
+        self.org = Organization.objects.create(name="Activity Org", default_locale="")
+
+    def _activity_inserts(self, queries):
+        return [q for q in queries if q['sql'].startswith('INSERT INTO "products_activity"')]
+
+    def test_rows_from_one_transaction_are_inserted_together(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            with transaction.atomic():
+                for n in range(3):
+                    Product.objects.create(name=f"P{n}", sku=f"ACT-{n}", organization=self.org)
+        self.assertFalse(Activity.objects.filter(entity='product').exists())
+        self.assertEqual(len(callbacks), 1)
+
+        with CaptureQueriesContext(connection) as ctx:
+            callbacks[0]()
+        self.assertEqual(len(self._activity_inserts(ctx.captured_queries)), 1)
+        self.assertEqual(Activity.objects.filter(entity='product', action='create').count(), 3)
+
+    def test_rolled_back_rows_are_not_written(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    Product.objects.create(name="Gone", sku="ACT-GONE", organization=self.org)
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+            Product.objects.create(name="Kept", sku="ACT-KEPT", organization=self.org)
+        messages = list(Activity.objects.filter(entity='product').values_list('message', flat=True))
+        self.assertEqual(messages, ["Created product 'Kept'"])
@@ -1,116 +1,136 @@
+from contextlib import contextmanager
+
+import pytest
+from django.db.models.signals import post_save
 from django.urls import reverse
-from django.test import TestCase
-from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient
 from rest_framework import status
 
+from teams.models import Membership, Role
+
 from ..models import Product, ProductEvent, Activity
+from ..signals import product_saved
+
+
+# Sub-resources dropped from products/urls.py; they have no route name left
+DEPRECATED_ENDPOINTS = ['versions', 'price-history']
 
-User = get_user_model()
+# (registered url name, fixture row the payload should contain)
+LIVE_ENDPOINTS = [
+    ('product-history-list', 'event'),
+    ('product-activities-list', 'activity'),
+]
 
+# dispatch_uid of the receiver in products/signals.py
+PRODUCT_SAVED_UID = 'products.product_saved'
 
-class APICleanupTests(TestCase):
+
+@contextmanager
+def product_saved_muted():
+    """Disconnect the Product post_save receiver for the duration."""
+    post_save.disconnect(sender=Product, dispatch_uid=PRODUCT_SAVED_UID)
+    try:
+        yield
+    finally:
+        post_save.connect(product_saved, sender=Product, dispatch_uid=PRODUCT_SAVED_UID)
+
+
+@pytest.fixture(scope='module')
+def cleanup_data(shared_org, shared_user, django_db_blocker):
     """
-    Test that deprecated endpoints return 404 and others still work.
+    Rows shared by every case in this module, created once and removed at
+    the end. Like the conftest fixtures they are committed, so get_or_create
+    keeps a rerun after an aborted session working with --reuse-db.
     """
-    
-    def setUp(self):
-        """Set up test data and authenticate the API client."""
-        # Create a test user
-        self.user = User.objects.create_user(
-            username="testuser", 
-            email="test@example.com",
-            password="testpassword123"
-        )
-        
-        # Create a test organization
-        from organizations.models import Organization
-        self.organization = Organization.objects.create(
-            name="Test Organization",
-            slug="test-org"
+    user, organization = shared_user, shared_org
+    with django_db_blocker.unblock():
+        # The endpoints only show rows of the user's active organization
+        membership, _ = Membership.objects.get_or_create(
+            user=user,
+            organization=organization,
+            defaults={
+                'role': Role.objects.get(name='Admin', organization=organization),
+                'status': 'active'
+            }
         )
-        
-        # Create a test product
-        self.product = Product.objects.create(
-            name="Test Product",
-            description="Test Description",
-            sku="TEST-123",
-            is_active=True,
-            organization=self.organization,
-            created_by=self.user
-        )
-        
+
+        # product_saved would add its own event and activity rows; the
+        # endpoints must return only the ones created here
+        with product_saved_muted():
+            # Create a test product
+            product, _ = Product.objects.get_or_create(
+                sku="TEST-123",
+                organization=organization,
+                defaults={
+                    'name': "Test Product",
+                    'description': "Test Description",
+                    'is_active': True,
+                    'created_by': user
+                }
+            )
+
         # Create a test product event
-        self.event = ProductEvent.objects.create(
+        event, _ = ProductEvent.objects.get_or_create(
+            product=product,
             event_type="created",
-            summary="Product was created",
-            payload={"product": self.product.id},
-            created_by=self.user,
-            product=self.product
+            defaults={
+                'summary': "Product was created",
+                'payload': {"product": product.id},
+                'created_by': user,
+                'organization': organization
+            }
         )
-        
+
         # Create a test activity
-        self.activity = Activity.objects.create(
+        activity, _ = Activity.objects.get_or_create(
             entity="product",
-            entity_id=self.product.id,
+            entity_id=product.id,
             action="view",
-            message="Product was viewed",
-            user=self.user,
-            organization=self.organization
-        )
-        
-        # Set up the API client
-        self.client = APIClient()
-        self.client.force_authenticate(user=self.user)
-    
-    def test_versions_endpoint_returns_404(self):
-        """Test that the deprecated versions endpoint returns 404."""
-        url = reverse(
-            'product-versions-list',  # This URL name should match what was registered in urls.py
-            kwargs={'product_pk': self.product.id}
-        )
-        
-        response = self.client.get(url)
-        
-        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
-    
-    def test_price_history_endpoint_returns_404(self):
-        """Test that the deprecated price-history endpoint returns 404."""
-        url = reverse(
-            'product-price-history-list',  # This URL name should match what was registered in urls.py
-            kwargs={'product_pk': self.product.id}
-        )
-        
-        response = self.client.get(url)
-        
-        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
-    
-    def test_history_endpoint_still_works(self):
-        """Test that the history endpoint still works."""
-        url = reverse(
-            'product-history-list',  # This URL name should match what was registered in urls.py
-            kwargs={'product_pk': self.product.id}
-        )
-        
-        response = self.client.get(url)
-        
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        
-        # Verify the response contains the event
-        self.assertEqual(len(response.data['results']), 1)
-        self.assertEqual(response.data['results'][0]['id'], self.event.id)
-    
-    def test_activities_endpoint_still_works(self):
-        """Test that the activities endpoint still works."""
-        url = reverse(
-            'product-activities-list',  # This URL name should match what was registered in urls.py
-            kwargs={'product_pk': self.product.id}
+            organization=organization,
+            defaults={'message': "Product was viewed", 'user': user}
         )
-        
-        response = self.client.get(url)
-        
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        
-        # Verify the response contains the activity
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['id'], self.activity.id) 
\ No newline at end of file
+
+    yield {'user': user, 'product': product, 'event': event, 'activity': activity}
+
+    with django_db_blocker.unblock():
+        # Deleting the product cascades to its event
+        activity.delete()
+        product.delete()
+        membership.delete()
+
+
+@pytest.fixture
+def api_client(cleanup_data, org):
+    client = APIClient()
+    client.force_authenticate(user=cleanup_data['user'])
+    return client
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('endpoint', DEPRECATED_ENDPOINTS)
+def test_deprecated_endpoints_return_404(api_client, cleanup_data, endpoint):
+    """
+    Deprecated endpoints below the product URL are gone.
+    """
+    url = reverse('product-detail', kwargs={'pk': cleanup_data['product'].id}) + f'{endpoint}/'
+
+    response = api_client.get(url)
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('url_name,row', LIVE_ENDPOINTS)
+def test_endpoints_still_work(api_client, cleanup_data, url_name, row):
+    """
+    The remaining endpoints still list their rows.
+    """
+    url = reverse(url_name, kwargs={'product_pk': cleanup_data['product'].id})
+
+    response = api_client.get(url)
+
+    assert response.status_code == status.HTTP_200_OK
+    # History is paginated, activities are returned as a plain list
+    results = response.data['results'] if 'results' in response.data else response.data
+    assert len(results) == 1
+    assert results[0]['id'] == cleanup_data[row].id
@@ -15,46 +15,49 @@ User = get_user_model()
 class ProductAttributeGroupViewSetTests(TestCase):
     """Tests for the `/api/products/<id>/attribute-groups/` endpoint."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         # Organisations
-        self.org = Organization.objects.create(name='Org')
-        self.other_org = Organization.objects.create(name='Other Org')
+        cls.org = Organization.objects.create(name='Org')
+        cls.other_org = Organization.objects.create(name='Other Org')
 
         # Role (required for membership helper)
-        self.role = Role.objects.create(name='Admin')
+        cls.role = Role.objects.create(name='Admin')
 
         # Users
-        self.user = User.objects.create_user(email='user@example.com', password='pass')
-        self.other_user = User.objects.create_user(email='other@example.com', password='pass')
+        cls.user = User.objects.create_user(email='user@example.com', password='pass')
+        cls.other_user = User.objects.create_user(email='other@example.com', password='pass')
 
-        # Memberships
-        Membership.objects.create(user=self.user, organization=self.org, role=self.role, status='active')
-        Membership.objects.create(user=self.other_user, organization=self.other_org, role=self.role, status='active')
+        # Memberships (no save() hooks or signals, so one multi-row INSERT)
+        Membership.objects.bulk_create([
+            Membership(user=cls.user, organization=cls.org, role=cls.role, status='active'),
+            Membership(user=cls.other_user, organization=cls.other_org, role=cls.role, status='active'),
+        ])
 
         # Product belonging to `self.org`
-        self.product = Product.objects.create(
-            name='Test Product', sku='SKU1', price=10, organization=self.org, created_by=self.user
+        cls.product = Product.objects.create(
+            name='Test Product', sku='SKU1', price=10, organization=cls.org, created_by=cls.user
         )
 
         # One attribute
-        self.attr = Attribute.objects.create(
-            code='color', label='Color', data_type='text', organization=self.org, created_by=self.user
+        cls.attr = Attribute.objects.create(
+            code='color', label='Color', data_type='text', organization=cls.org, created_by=cls.user
         )
 
         # Attribute group w/ one item pointing to attr
-        self.group = AttributeGroup.objects.create(name='Specs', organization=self.org, created_by=self.user)
-        AttributeGroupItem.objects.create(group=self.group, attribute=self.attr, order=0)
+        cls.group = AttributeGroup.objects.create(name='Specs', organization=cls.org, created_by=cls.user)
+        AttributeGroupItem.objects.create(group=cls.group, attribute=cls.attr, order=0)
+
+        cls.attr_groups_url = reverse('product-attribute-groups-list', kwargs={'product_pk': cls.product.pk})
 
+    def setUp(self):
         # API client
         self.client = APIClient()
 
-    def _get_url(self):
-        return reverse('product-attribute-groups-list', kwargs={'product_pk': self.product.pk})
-
     def test_returns_empty_when_no_attribute_values(self):
         """If the product has no AttributeValue rows, endpoint should return an empty list."""
         self.client.force_authenticate(user=self.user)
-        response = self.client.get(self._get_url())
+        response = self.client.get(self.attr_groups_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data, [])
 
@@ -70,7 +73,10 @@ class ProductAttributeGroupViewSetTests(TestCase):
         )
 
         self.client.force_authenticate(user=self.user)
-        response = self.client.get(self._get_url())
+        # Membership, product + family links + overrides, groups, items with
+        # their attributes, values (prefetch and lookup map), last_login write
+        with self.assertNumQueries(11):
+            response = self.client.get(self.attr_groups_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         # exactly the one group we created
         self.assertEqual(len(response.data), 1)
@@ -0,0 +1,58 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from organizations.models import Organization
+from products.models import Attribute, AttributeValue, Product
+from products.serializers import AttributeValueDetailSerializer
+from products.views.attribute_value import AttributeValueViewSet, ProductAttributeValueList
+from teams.models import Membership, Role
+
+User = get_user_model()
+
+
+class AttributeValueListQueryTests(TestCase):
+    """
+    Test that the attribute value list querysets load the attribute eagerly,
+    so AttributeValueDetailSerializer adds no per-row queries.
+    """
+
+    def setUp(self):
+        self.org = Organization.objects.create(name="Values Org", default_locale="")
+        self.user = User.objects.create_user(username='values', email='values@example.com', password='password')
+        Membership.objects.create(user=self.user, organization=self.org,
+                                  role=Role.objects.create(name="Admin"), status='active')
+        self.product = Product.objects.create(name="P", sku="P-1", organization=self.org, created_by=self.user)
+        for i in range(3):
+            attribute = Attribute.objects.create(organization=self.org, code=f'a{i}', label=f'A{i}',
+                                                 data_type='text', created_by=self.user)
+            AttributeValue.objects.create(organization=self.org, product=self.product,
+                                          attribute=attribute, value=f'v{i}')
+
+    def _view(self, view_class, **kwargs):
+        request = Request(APIRequestFactory().get('/'))
+        request.user = self.user
+        view = view_class()
+        view.setup(request, **kwargs)
+        view.request = request
+        view.format_kwarg = None
+        view.action = 'list'
+        return view
+
+    def _assert_serializes_without_queries(self, queryset):
+        values = list(queryset)
+        self.assertEqual(len(values), 3)
+        # Columns the serializer does not render are left unloaded
+        self.assertIn('created_by_id', values[0].get_deferred_fields())
+        with self.assertNumQueries(0):
+            data = AttributeValueDetailSerializer(values, many=True).data
+        self.assertEqual(sorted(row['attribute_code'] for row in data), ['a0', 'a1', 'a2'])
+
+    def test_viewset_queryset(self):
+        view = self._view(AttributeValueViewSet, product_pk=self.product.pk)
+        self._assert_serializes_without_queries(view.get_queryset())
+
+    def test_product_list_queryset(self):
+        view = self._view(ProductAttributeValueList, product_id=self.product.pk)
+        self._assert_serializes_without_queries(view.get_queryset())
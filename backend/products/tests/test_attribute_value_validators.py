@@ -0,0 +1,81 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+from rest_framework import serializers
+
+from organizations.models import Organization
+from products.models import Attribute, AttributeValue
+from products.serializers import _VALUE_VALIDATORS, AttributeValueSerializer
+
+
+class AttributeValueValidatorTests(SimpleTestCase):
+    """The per-data_type validators used by AttributeValueSerializer.validate."""
+
+    def run_validator(self, data_type, value, context=None):
+        attr = Attribute(label='Field', data_type=data_type)
+        return _VALUE_VALIDATORS[data_type](value, attr, context or {})
+
+    def test_number_keeps_int_float_distinction(self):
+        self.assertEqual(self.run_validator('number', '3'), 3)
+        self.assertIsInstance(self.run_validator('number', '3.0'), int)
+        self.assertEqual(self.run_validator('number', 2.5), 2.5)
+        self.assertEqual(self.run_validator('number', '0.1'), 0.1)
+        self.assertEqual(self.run_validator('number', '12345678901234567891'), 12345678901234567891)
+        for invalid in ('abc', None, True, 'nan', float('inf'), [1]):
+            with self.assertRaises(serializers.ValidationError):
+                self.run_validator('number', invalid)
+
+    def test_boolean_strings(self):
+        self.assertIs(self.run_validator('boolean', 'Yes'), True)
+        self.assertIs(self.run_validator('boolean', '0'), False)
+        self.assertIs(self.run_validator('boolean', 'FALSE'), False)
+        self.assertIs(self.run_validator('boolean', 1), True)
+        for invalid in ('maybe', 'true ', 'yes please'):
+            with self.assertRaises(serializers.ValidationError):
+                self.run_validator('boolean', invalid)
+
+    def test_date(self):
+        self.assertEqual(self.run_validator('date', '2024-02-29'), '2024-02-29')
+        with self.assertRaisesMessage(serializers.ValidationError, 'Invalid date value'):
+            self.run_validator('date', '2023-02-29')
+        with self.assertRaisesMessage(serializers.ValidationError, 'ISO-8601 format'):
+            self.run_validator('date', '2024-2-1')
+
+    def test_measurement_units(self):
+        value = self.run_validator('measurement', {'amount': '2', 'unit': 'kg'}, {'allowed_units': ['kg']})
+        self.assertEqual(value, {'amount': 2.0, 'unit': 'kg'})
+        with self.assertRaisesMessage(serializers.ValidationError, 'Invalid measurement unit'):
+            self.run_validator('measurement', {'amount': 1, 'unit': 'lb'}, {'allowed_units': ['kg']})
+
+    def test_media_uses_precomputed_asset_ids(self):
+        context = {'valid_asset_ids': {7}}
+        self.assertEqual(self.run_validator('media', {'asset_id': '7'}, context), {'asset_id': 7})
+        with self.assertRaises(serializers.ValidationError):
+            self.run_validator('media', {'asset_id': 8}, context)
+
+    def test_phone_is_normalized_to_e164(self):
+        self.assertEqual(self.run_validator('phone', '(202) 555-0143'), '+12025550143')
+        with self.assertRaisesMessage(serializers.ValidationError, 'Could not parse'):
+            self.run_validator('phone', 'not a number')
+
+
+class AttributeValueUnchangedUpdateTests(SimpleTestCase):
+    """AttributeValueSerializer.validate skips re-validating untouched values."""
+
+    def setUp(self):
+        org = Organization(id=1)
+        attr = Attribute(id=1, organization=org, label='Field', data_type='number')
+        # Stored before number validation existed; the validator would reject it
+        self.instance = AttributeValue(id=1, organization=org, product_id=1, attribute=attr, value='legacy')
+        self.serializer = AttributeValueSerializer(instance=self.instance, context={'request': mock.Mock()})
+        patcher = mock.patch('products.serializers._get_request_organization', return_value=org)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_resubmitted_value_is_not_revalidated(self):
+        data = self.serializer.validate({'value': 'legacy', 'attribute': self.instance.attribute})
+        self.assertEqual(data['value'], 'legacy')
+
+    def test_value_is_revalidated_when_channel_changes(self):
+        with self.assertRaises(serializers.ValidationError):
+            self.serializer.validate({'value': 'legacy', 'channel': 'web'})
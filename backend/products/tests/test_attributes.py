@@ -1,5 +1,5 @@
 from django.urls import reverse
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from rest_framework.test import APIClient
 from rest_framework import status
 from products.models import Attribute, AttributeValue, Product
@@ -10,83 +10,87 @@ import json
 
 User = get_user_model()
 
+# Passwords are never checked here; skip PBKDF2 under manage.py test as well
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
 class AttributeTests(TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         # Create test organizations
-        self.org1 = Organization.objects.create(name="Organization 1")
-        self.org2 = Organization.objects.create(name="Organization 2")
+        cls.org1 = Organization.objects.create(name="Organization 1")
+        cls.org2 = Organization.objects.create(name="Organization 2")
 
         # Create role for memberships
-        self.role = Role.objects.create(name="Admin")
+        cls.role = Role.objects.create(name="Admin")
         
         # Create users and add to organizations via memberships
-        self.staff_user = User.objects.create_user(
+        cls.staff_user = User.objects.create_user(
             email='staff@example.com',
             password='password',
         )
-        self.staff_user.is_staff = True
-        self.staff_user.save()
+        cls.staff_user.is_staff = True
+        cls.staff_user.save()
         
         # Create membership for staff user in org1
         Membership.objects.create(
-            user=self.staff_user,
-            organization=self.org1,
-            role=self.role,
+            user=cls.staff_user,
+            organization=cls.org1,
+            role=cls.role,
             status='active'
         )
         
-        self.regular_user = User.objects.create_user(
+        cls.regular_user = User.objects.create_user(
             email='user@example.com',
             password='password'
         )
         
         # Create membership for regular user in org1
         Membership.objects.create(
-            user=self.regular_user,
-            organization=self.org1,
-            role=self.role,
+            user=cls.regular_user,
+            organization=cls.org1,
+            role=cls.role,
             status='active'
         )
         
-        self.other_org_user = User.objects.create_user(
+        cls.other_org_user = User.objects.create_user(
             email='other@example.com',
             password='password'
         )
         
         # Create membership for other user in org2
         Membership.objects.create(
-            user=self.other_org_user,
-            organization=self.org2,
-            role=self.role,
+            user=cls.other_org_user,
+            organization=cls.org2,
+            role=cls.role,
             status='active'
         )
         
         # Create test product
-        self.product = Product.objects.create(
+        cls.product = Product.objects.create(
             name="Test Product",
             sku="TEST001",
             price=10.00,
-            organization=self.org1,
-            created_by=self.staff_user
+            organization=cls.org1,
+            created_by=cls.staff_user
         )
         
         # Create test attributes
-        self.attr1 = Attribute.objects.create(
+        cls.attr1 = Attribute.objects.create(
             code="color",
             label="Color",
             data_type="text",
-            organization=self.org1,
-            created_by=self.staff_user
+            organization=cls.org1,
+            created_by=cls.staff_user
         )
         
-        self.attr2 = Attribute.objects.create(
+        cls.attr2 = Attribute.objects.create(
             code="weight",
             label="Weight",
             data_type="number",
-            organization=self.org1,
-            created_by=self.staff_user
+            organization=cls.org1,
+            created_by=cls.staff_user
         )
-        
+
+    def setUp(self):
         # Setup API client
         self.client = APIClient()
     
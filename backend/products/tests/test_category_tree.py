@@ -0,0 +1,51 @@
+from django.test import TestCase
+
+from ..models import Category
+from ..serializers import CategorySerializer
+
+
+def _walk(node):
+    """Reference output built by walking get_children() recursively"""
+    return {
+        'id': node.id,
+        'name': node.name,
+        'parent': node.parent_id,
+        'children': [_walk(child) for child in node.get_children()],
+    }
+
+
+class CategorySerializerTreeTests(TestCase):
+    """
+    Test that CategorySerializer nests the full subtree from a single query.
+    """
+
+    def setUp(self):
+        self.root = Category.objects.create(name="Vehicles")
+        self.cars = Category.objects.create(name="Cars", parent=self.root)
+        Category.objects.create(name="Bikes", parent=self.root)
+        Category.objects.create(name="Sedans", parent=self.cars)
+        Category.objects.create(name="Tools")
+        self.cars.refresh_from_db()
+
+    def test_roots_match_recursive_walk(self):
+        roots = Category.objects.filter(parent__isnull=True)
+        self.assertEqual(
+            CategorySerializer(roots, many=True).data,
+            [_walk(root) for root in roots]
+        )
+
+    def test_single_node_matches_recursive_walk(self):
+        self.assertEqual(CategorySerializer(self.cars).data, _walk(self.cars))
+
+    def test_tree_uses_one_query(self):
+        roots = list(Category.objects.filter(parent__isnull=True))
+        with self.assertNumQueries(1):
+            CategorySerializer(roots, many=True).data
+
+    def test_stale_node_is_refreshed(self):
+        """A node whose lft/rght changed after it was loaded still serializes"""
+        root = Category.objects.get(pk=self.root.pk)
+        Category.objects.create(name="Trucks", parent=root)
+        stale = Category.objects.get(pk=self.root.pk)
+        Category.objects.create(name="Vans", parent=Category.objects.get(pk=self.root.pk))
+        self.assertEqual(CategorySerializer(stale).data, _walk(Category.objects.get(pk=self.root.pk)))
@@ -0,0 +1,68 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+
+from ..models import Category, Product
+
+User = get_user_model()
+
+
+class CompletenessCacheTests(TestCase):
+    """
+    Test that the denormalized completeness columns track product writes.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="cacheuser",
+            email="cache@example.com",
+            password="testpassword123"
+        )
+        self.product = Product.objects.create(
+            name="Cached Product",
+            sku="CACHE-1",
+            created_by=self.user
+        )
+        self.product.refresh_completeness_cache()
+
+    def _stored(self):
+        return Product.objects.values_list('completeness_cache', 'missing_fields_cache').get(pk=self.product.pk)
+
+    def test_refresh_persists_cache(self):
+        """refresh_completeness_cache stores the computed values"""
+        self.assertEqual(
+            self._stored(),
+            (self.product.get_completeness(), self.product.get_missing_fields())
+        )
+
+    def test_relevant_save_marks_cache_stale(self):
+        """Filling a completeness field clears the cache in the same write"""
+        self.product.brand = "Acme"
+        self.product.save(update_fields=['brand'])
+        self.assertEqual(self._stored(), (None, None))
+
+    def test_unrelated_save_keeps_cache(self):
+        """Saving fields completeness ignores leaves the cache alone"""
+        before = self._stored()
+        self.product.is_active = False
+        self.product.save(update_fields=['is_active'])
+        self.assertEqual(self._stored(), before)
+
+    def test_stale_cache_computed_on_read_without_write(self):
+        """A NULL cache is computed in memory; reads never write"""
+        Product.objects.filter(pk=self.product.pk).update(
+            completeness_cache=None,
+            missing_fields_cache=None
+        )
+        product = Product.objects.get(pk=self.product.pk)
+        self.assertEqual(product.get_cached_completeness(), product.get_completeness())
+        self.assertEqual(product.get_cached_missing_fields(), product.get_missing_fields())
+        self.assertEqual(self._stored(), (None, None))
+
+    def test_category_delete_marks_cache_stale(self):
+        """Deleting a category nulls Product.category without save()"""
+        category = Category.objects.create(name="Doomed")
+        self.product.category = category
+        self.product.save()
+        self.product.refresh_completeness_cache()
+        category.delete()
+        self.assertEqual(self._stored(), (None, None))
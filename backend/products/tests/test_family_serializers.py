@@ -1,7 +1,7 @@
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from django.urls import reverse
 from rest_framework.test import APIRequestFactory, force_authenticate
-from rest_framework import status
+from rest_framework import serializers, status
 from unittest import mock
 from django.contrib.auth import get_user_model
 from django.db.models import QuerySet
@@ -16,7 +16,9 @@ from teams.models import Membership, Role
 
 User = get_user_model()
 
-class FamilySerializerTests(TestCase):
+class FamilySerializerMocksMixin:
+    """Mocked organization, models and manager lookups shared by the serializer tests"""
+
     def setUp(self):
         # Create mocks
         self.user = mock.MagicMock()
@@ -88,7 +90,11 @@ class FamilySerializerTests(TestCase):
         self.familyattrgroup_filter_patcher.stop()
         self.attrgroupitem_filter_patcher.stop()
         self.attribute_filter_patcher.stop()
-    
+
+
+class FamilySerializerTests(FamilySerializerMocksMixin, SimpleTestCase):
+    """Validation paths that only touch mocked managers, so no database"""
+
     def test_duplicate_family_code_validation(self):
         """Test that creating a family with a duplicate code fails validation"""
         request = self.factory.post('/api/families/')
@@ -107,7 +113,11 @@ class FamilySerializerTests(TestCase):
         serializer = FamilySerializer(data=data, context={'request': request})
         self.assertFalse(serializer.is_valid())
         self.assertIn('code', serializer.errors)
-    
+
+
+class FamilySerializerDatabaseTests(FamilySerializerMocksMixin, TestCase):
+    """Serializer paths that still reach the database (pk field lookups, saves)"""
+
     def test_family_required_attributes_validation(self):
         """Test that assigning a family with required attributes to a product without those attributes fails validation"""
         request = self.factory.patch(f'/api/products/{self.product.id}/')
@@ -196,4 +206,123 @@ class FamilySerializerTests(TestCase):
         # Check that new attribute group was added
         family_group = updated_family.attribute_groups.first()
         self.assertEqual(family_group.attribute_group.id, new_group.id)
-        self.assertTrue(family_group.required) 
\ No newline at end of file
+        self.assertTrue(family_group.required)
+
+
+class ValidateFamilyQueryTests(TestCase):
+    """
+    Test that ProductSerializer.validate_family resolves missing attributes in one query.
+    """
+
+    def setUp(self):
+        self.org = Organization.objects.create(name="Family Org", default_locale="")
+        self.product = Product.objects.create(name="Product", sku="VF-1", organization=self.org)
+        self.family = Family.objects.create(code="vf-family", label="VF Family", organization=self.org)
+        group = AttributeGroup.objects.create(name="Required", organization=self.org)
+        optional = AttributeGroup.objects.create(name="Optional", organization=self.org)
+        self.color = Attribute.objects.create(organization=self.org, code="color", label="Color", data_type="text")
+        self.size = Attribute.objects.create(organization=self.org, code="size", label="Size", data_type="text")
+        self.note = Attribute.objects.create(organization=self.org, code="note", label="Note", data_type="text")
+        AttributeGroupItem.objects.create(group=group, attribute=self.color, order=0)
+        AttributeGroupItem.objects.create(group=group, attribute=self.size, order=1)
+        AttributeGroupItem.objects.create(group=optional, attribute=self.note, order=0)
+        FamilyAttributeGroup.objects.create(family=self.family, attribute_group=group, required=True, organization=self.org)
+        FamilyAttributeGroup.objects.create(family=self.family, attribute_group=optional, required=False, organization=self.org)
+        AttributeValue.objects.create(organization=self.org, product=self.product, attribute=self.color, value="red")
+
+    def test_reports_only_missing_required_attributes(self):
+        serializer = ProductSerializer(instance=self.product)
+        with self.assertNumQueries(1):
+            with self.assertRaises(serializers.ValidationError) as ctx:
+                serializer.validate_family(self.family)
+        message = str(ctx.exception)
+        self.assertIn("Size", message)
+        self.assertNotIn("Color", message)
+        self.assertNotIn("Note", message)
+
+    def test_passes_when_required_values_exist(self):
+        AttributeValue.objects.create(organization=self.org, product=self.product, attribute=self.size, value="M")
+        serializer = ProductSerializer(instance=self.product)
+        self.assertEqual(serializer.validate_family(self.family), self.family)
+
+
+class FamilyUpdateAttributeGroupsTests(TestCase):
+    """
+    Test that FamilySerializer.update diffs the family's attribute group links.
+    """
+
+    def setUp(self):
+        self.org = Organization.objects.create(name="Diff Org", default_locale="")
+        self.family = Family.objects.create(code="diff-family", label="Diff Family", organization=self.org)
+        self.kept, self.removed, self.added = [
+            AttributeGroup.objects.create(name=name, organization=self.org)
+            for name in ("Kept", "Removed", "Added")
+        ]
+        self.kept_link = FamilyAttributeGroup.objects.create(
+            family=self.family, attribute_group=self.kept, required=False, order=0, organization=self.org
+        )
+        FamilyAttributeGroup.objects.create(
+            family=self.family, attribute_group=self.removed, order=1, organization=self.org
+        )
+
+    def _update(self, attribute_groups):
+        serializer = FamilySerializer(instance=self.family, data={'attribute_groups': attribute_groups}, partial=True)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        return serializer
+
+    def test_keeps_matching_rows_and_applies_changes(self):
+        self._update([
+            {'attribute_group': self.kept.id, 'required': True, 'order': 1},
+            {'attribute_group': self.added.id, 'order': 0},
+        ]).save()
+        links = {link.attribute_group_id: link for link in self.family.attribute_groups.all()}
+        self.assertEqual(set(links), {self.kept.id, self.added.id})
+        self.assertEqual(links[self.kept.id].pk, self.kept_link.pk)
+        self.assertTrue(links[self.kept.id].required)
+        self.assertEqual(links[self.kept.id].order, 1)
+        self.assertEqual(links[self.added.id].organization, self.org)
+
+    def test_unchanged_payload_writes_nothing(self):
+        serializer = self._update([
+            {'attribute_group': self.kept.id, 'required': False, 'order': 0},
+            {'attribute_group': self.removed.id, 'order': 1},
+        ])
+        # Family UPDATE (in a savepoint) plus the read of the existing links
+        with self.assertNumQueries(4):
+            serializer.save()
+
+    def test_rejects_repeated_attribute_group(self):
+        serializer = self._update([
+            {'attribute_group': self.kept.id},
+            {'attribute_group': self.kept.id, 'order': 3},
+        ])
+        with self.assertRaises(serializers.ValidationError):
+            serializer.save()
+
+
+class FamilyCodeUniquenessTests(TestCase):
+    """
+    Test that family codes are unique per organization and that a
+    constraint violation surfaces as a validation error.
+    """
+
+    def setUp(self):
+        self.org = Organization.objects.create(name="Code Org", default_locale="")
+        self.other_org = Organization.objects.create(name="Other Code Org", default_locale="")
+        Family.objects.create(code="shared", label="Shared", organization=self.org)
+
+    def test_same_code_in_another_organization(self):
+        family = FamilySerializer().create({'code': 'shared', 'label': 'Other', 'organization': self.other_org})
+        self.assertEqual(family.organization, self.other_org)
+
+    def test_duplicate_code_past_validation_is_a_validation_error(self):
+        # Simulates a concurrent request that passed validate_code
+        with self.assertRaises(serializers.ValidationError) as ctx:
+            FamilySerializer().create({'code': 'shared', 'label': 'Again', 'organization': self.org})
+        self.assertIn('code', ctx.exception.detail)
+        self.assertEqual(Family.objects.filter(organization=self.org).count(), 1)
+
+    def test_duplicate_code_without_organization(self):
+        Family.objects.create(code="orphan", label="Orphan")
+        with self.assertRaises(serializers.ValidationError):
+            FamilySerializer().create({'code': 'orphan', 'label': 'Orphan again'})
@@ -0,0 +1,52 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from organizations.models import Organization
+from teams.models import Membership, Role
+from products.models import Product, ProductAsset
+
+User = get_user_model()
+
+
+class FastProductListTests(TestCase):
+    """
+    Test that ``?fast=1`` picks the same list image as the regular list.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.org = Organization.objects.create(name="Fast List Org", default_locale="")
+        cls.user = User.objects.create_user(
+            username="fastlistuser",
+            email="fastlist@example.com",
+            password="testpassword123",
+            is_staff=True
+        )
+        # The organization's post_save handler seeds its default roles
+        role = Role.objects.get(name="Admin", organization=cls.org)
+        Membership.objects.create(user=cls.user, organization=cls.org, role=role, status='active')
+
+        cls.with_primary = Product.objects.create(name="Primary", sku="FAST-1", organization=cls.org, created_by=cls.user)
+        cls.image_only = Product.objects.create(name="Image", sku="FAST-2", organization=cls.org, created_by=cls.user)
+        cls.no_image = Product.objects.create(name="Document", sku="FAST-3", organization=cls.org, created_by=cls.user)
+        ProductAsset.objects.bulk_create([
+            ProductAsset(product=cls.with_primary, organization=cls.org, file="product_assets/other.png", asset_type='image', order=0),
+            ProductAsset(product=cls.with_primary, organization=cls.org, file="product_assets/primary.png", asset_type='image', order=1, is_primary=True),
+            ProductAsset(product=cls.image_only, organization=cls.org, file="product_assets/second.png", asset_type='image', order=1),
+            ProductAsset(product=cls.image_only, organization=cls.org, file="product_assets/first.png", asset_type='image', order=0),
+            ProductAsset(product=cls.no_image, organization=cls.org, file="product_assets/spec.pdf", asset_type='pdf'),
+        ])
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_primary_asset_then_first_image(self):
+        response = self.client.get('/api/products/', {'fast': '1'})
+        self.assertEqual(response.status_code, 200, response.content)
+
+        urls = {row['id']: row['primary_asset_url'] for row in response.data['results']}
+        self.assertTrue(urls[self.with_primary.id].endswith('primary.png'))
+        self.assertTrue(urls[self.image_only.id].endswith('first.png'))
+        self.assertIsNone(urls[self.no_image.id])
@@ -0,0 +1,30 @@
+from decimal import Decimal
+from datetime import datetime, timezone
+
+import orjson
+from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+
+from kernlogic.renderers import ORJSONRenderer
+
+
+class ORJSONRendererTests(TestCase):
+    """
+    Test that ORJSONRenderer matches JSONRenderer.
+    """
+
+    def test_matches_stock_renderer(self):
+        """Decimals and datetimes are encoded the same way as JSONRenderer"""
+        data = {
+            'price': Decimal('9.90'),
+            'created_at': datetime(2025, 5, 18, 15, 7, 1, 123456, tzinfo=timezone.utc),
+            'name': 'Widget',
+        }
+        self.assertEqual(
+            orjson.loads(ORJSONRenderer().render(data)),
+            orjson.loads(JSONRenderer().render(data))
+        )
+
+    def test_none_renders_empty(self):
+        """None renders as an empty body"""
+        self.assertEqual(ORJSONRenderer().render(None), b'')
@@ -0,0 +1,48 @@
+from django.db.models import Prefetch, Q
+from django.test import TestCase
+
+from organizations.models import Organization
+from products.models import Product, ProductAsset
+from products.serializers import ProductListSerializer
+
+
+class ProductListPrimaryAssetTests(TestCase):
+    """
+    Test that ProductListSerializer resolves the primary asset from prefetched rows.
+    """
+
+    def setUp(self):
+        self.org = Organization.objects.create(name="Asset Org", default_locale="")
+        self.with_primary = Product.objects.create(name="A", sku="A-1", organization=self.org)
+        self.image_only = Product.objects.create(name="B", sku="B-1", organization=self.org)
+        ProductAsset.objects.create(product=self.with_primary, file='product_assets/doc.pdf', asset_type='document', order=0)
+        ProductAsset.objects.create(product=self.with_primary, file='product_assets/main.png', is_primary=True, order=2)
+        ProductAsset.objects.create(product=self.image_only, file='product_assets/second.png', order=1)
+        ProductAsset.objects.create(product=self.image_only, file='product_assets/first.png', order=0)
+
+    def _urls(self, products):
+        data = ProductListSerializer(products, many=True).data
+        return {row['sku']: row['primary_asset_url'] for row in data}
+
+    def test_primary_then_first_image(self):
+        urls = self._urls(Product.objects.filter(pk__in=[self.with_primary.pk, self.image_only.pk]))
+        self.assertTrue(urls['A-1'].endswith('main.png'))
+        self.assertTrue(urls['B-1'].endswith('first.png'))
+
+    def test_prefetched_assets_need_no_queries(self):
+        products = list(
+            Product.objects.filter(organization=self.org).select_related('category', 'family').prefetch_related(
+                Prefetch(
+                    'assets',
+                    queryset=ProductAsset.objects.filter(
+                        Q(is_primary=True) | Q(asset_type__icontains='image')
+                    ).order_by('-is_primary', 'order')[:1],
+                    to_attr='primary_assets'
+                )
+            )
+        )
+        serializer = ProductListSerializer(products, many=True)
+        with self.assertNumQueries(0):
+            urls = {p.sku: serializer.child.get_primary_asset_url(p) for p in products}
+        self.assertTrue(urls['A-1'].endswith('main.png'))
+        self.assertTrue(urls['B-1'].endswith('first.png'))
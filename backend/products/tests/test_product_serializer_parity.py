@@ -0,0 +1,103 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework import serializers
+
+from organizations.models import Organization
+from prices.models import Currency, PriceType
+from products.models import (
+    Attribute, AttributeGroup, AttributeGroupItem, AttributeValue, Category, Family,
+    FamilyAttributeGroup, Product, ProductAsset, ProductFamilyOverride, ProductPrice
+)
+from products.serializers import PlannedRepresentationMixin, ProductSerializer
+
+User = get_user_model()
+
+
+class StockProductSerializer(ProductSerializer):
+    """ProductSerializer rendered through DRF's own field loop."""
+
+    def to_representation(self, instance):
+        representation = serializers.ModelSerializer.to_representation(self, instance)
+        if 'category' not in representation:
+            representation['category'] = []
+        return representation
+
+
+class ProductSerializerParityTests(TestCase):
+    """
+    Test that PlannedRepresentationMixin renders exactly what DRF's
+    ModelSerializer.to_representation would, for every ProductSerializer field.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.org = Organization.objects.create(name="Parity Org", default_locale="")
+        cls.user = User.objects.create_user(
+            username="parityuser",
+            email="parity@example.com",
+            password="testpassword123"
+        )
+        root = Category.objects.create(name="Root", organization=cls.org)
+        leaf = Category.objects.create(name="Leaf", parent=root, organization=cls.org)
+        attribute = Attribute.objects.create(
+            organization=cls.org, code="color", label="Color", data_type="text", created_by=cls.user
+        )
+        group = AttributeGroup.objects.create(name="Specs", organization=cls.org, created_by=cls.user)
+        AttributeGroupItem.objects.create(group=group, attribute=attribute, order=0)
+        family = Family.objects.create(code="parity", label="Parity", organization=cls.org)
+        FamilyAttributeGroup.objects.create(family=family, attribute_group=group, organization=cls.org)
+        currency = Currency.objects.create(iso_code="USD", symbol="$", name="US Dollar", organization=cls.org)
+        price_type = PriceType.objects.create(code="base", label="Base Price", organization=cls.org)
+
+        # One product with every relation filled in, one with none
+        full = Product.objects.create(
+            name="Full", sku="PARITY-1", description="Described", brand="Acme", barcode="123",
+            tags='["a", "b"]', category=leaf, family=family, organization=cls.org, created_by=cls.user
+        )
+        Product.objects.create(name="Bare", sku="PARITY-2", organization=cls.org)
+        AttributeValue.objects.create(
+            organization=cls.org, product=full, attribute=attribute, value="red", created_by=cls.user
+        )
+        ProductPrice.objects.create(
+            product=full, price_type=price_type, currency=currency, amount=Decimal("9.99"), organization=cls.org
+        )
+        ProductAsset.objects.create(
+            product=full, organization=cls.org, file="product_assets/full.png",
+            asset_type="image", is_primary=True, uploaded_by=cls.user
+        )
+        ProductFamilyOverride.objects.create(product=full, attribute_group=group, organization=cls.org)
+
+    def setUp(self):
+        self.queryset = ProductSerializer.setup_eager_loading(
+            Product.objects.filter(organization=self.org).order_by('sku')
+        )
+
+    def test_matches_drf_representation(self):
+        planned = ProductSerializer(self.queryset, many=True).data
+        stock = StockProductSerializer(self.queryset, many=True).data
+
+        self.assertEqual(len(planned), 2)
+        # The full product must exercise every nested and method field
+        for name in ('prices', 'category', 'tags', 'attribute_values', 'assets', 'primary_asset', 'family_overrides'):
+            self.assertTrue(planned[0][name], name)
+        for planned_row, stock_row in zip(planned, stock):
+            self.assertEqual(list(planned_row), list(stock_row))
+            self.assertEqual(dict(planned_row), dict(stock_row))
+
+    def test_plan_covers_every_readable_field(self):
+        serializer = ProductSerializer(self.queryset, many=True).child
+        plan = serializer._representation_plan()
+
+        self.assertEqual(
+            [field.field_name for _, field, _ in plan],
+            [field.field_name for field in serializer._readable_fields]
+        )
+        kinds = {field.field_name: kind for kind, field, _ in plan}
+        self.assertEqual(kinds['name'], PlannedRepresentationMixin._PLAIN)
+        self.assertEqual(kinds['assets'], PlannedRepresentationMixin._METHOD)
+        # Relations and nested serializers keep DRF's generic path
+        self.assertEqual(kinds['family'], PlannedRepresentationMixin._GENERIC)
+        self.assertEqual(kinds['prices'], PlannedRepresentationMixin._GENERIC)
+        self.assertEqual(kinds['created_by'], PlannedRepresentationMixin._GENERIC)
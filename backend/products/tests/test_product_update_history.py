@@ -0,0 +1,52 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from organizations.models import Organization
+from teams.models import Membership, Role
+from products.models import Product, ProductEvent
+
+User = get_user_model()
+
+
+class ProductUpdateHistoryTests(TestCase):
+    """
+    Test that the 'updated' event only records editable product data.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.org = Organization.objects.create(name="History Org", default_locale="")
+        cls.user = User.objects.create_user(
+            username="historyuser",
+            email="history@example.com",
+            password="testpassword123",
+            is_staff=True
+        )
+        # The organization's post_save handler seeds its default roles
+        role, _ = Role.objects.get_or_create(name="Admin", organization=cls.org)
+        role.permissions = ["product.view", "product.change"]
+        role.save()
+        Membership.objects.create(user=cls.user, organization=cls.org, role=role, status='active')
+        cls.product = Product.objects.create(
+            name="History Product",
+            sku="HIST-1",
+            organization=cls.org,
+            created_by=cls.user
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_patch_records_only_changed_fields(self):
+        """Changing brand does not log timestamps or completeness caches"""
+        response = self.client.patch(
+            f'/api/products/{self.product.id}/', {'brand': 'Acme'}, format='json'
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+
+        event = ProductEvent.objects.filter(product=self.product, event_type='updated').latest('id')
+        self.assertEqual(set(event.payload['changes']), {'brand'})
+        for internal in ('completeness_cache', 'missing_fields_cache', 'created_at', 'updated_at'):
+            self.assertNotIn(internal, event.payload['old_data'])
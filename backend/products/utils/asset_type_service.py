@@ -2,7 +2,6 @@
 Shared asset type detection service for determining file types consistently.
 This matches the frontend TypeScript implementation for consistency.
 """
-import os
 import re
 from typing import Union, Dict, Any, Optional, List
 
@@ -20,6 +19,25 @@ ASSET_TYPES = [
 ]
 
 
+# Extension -> asset type, built once at import
+_EXTENSION_TYPES = {
+    extension: asset_type
+    for asset_type, extensions in (
+        ('image', ('jpg', 'jpeg', 'png', 'gif', 'svg', 'webp', 'bmp', 'tif', 'tiff', 'ico', 'heic', 'avif')),
+        ('video', ('mp4', 'webm', 'mov', 'avi', 'wmv', 'flv', 'mkv', 'm4v', 'mpg', 'mpeg')),
+        ('audio', ('mp3', 'wav', 'ogg', 'aac', 'flac', 'm4a', 'wma')),
+        ('pdf', ('pdf',)),
+        ('model', ('obj', 'stl', 'glb', 'gltf', 'fbx', '3ds', 'dae', 'blend')),
+        ('spreadsheet', ('xls', 'xlsx', 'csv', 'numbers', 'ods', 'gsheet')),
+        ('document', ('doc', 'docx', 'rtf', 'txt', 'md', 'pages', 'odt', 'ppt', 'pptx', 'odp', 'key')),
+    )
+    for extension in extensions
+}
+
+# Final extension of a filename or URL path, ignoring any query string or fragment
+_EXTENSION_RE = re.compile(r'\.([a-z0-9]+)(?:[?#]|$)', re.IGNORECASE)
+
+
 class AssetTypeService:
     """Centralized service for asset type detection and classification"""
     
@@ -59,7 +77,7 @@ class AssetTypeService:
                 return AssetTypeService.detect_type_from_extension(file_or_content_type.name)
         
         # Handle models and dictionary-like objects
-        elif hasattr(file_or_content_type, 'get') or hasattr(file_or_content_type, '__getitem__'):
+        else:
             # Try various attribute names used in the project
             try:
                 # Using getattr for models and get for dicts
@@ -110,6 +128,10 @@ class AssetTypeService:
             
         # If we found a MIME type, detect based on it
         if mime_type:
+            # Asset objects may already carry a standardized type name
+            if mime_type in ASSET_TYPES:
+                return mime_type
+
             # Image types
             if mime_type.startswith('image/'):
                 return 'image'
@@ -183,37 +205,10 @@ class AssetTypeService:
             return 'unknown'
             
         # Extract extension from filename or URL
-        extension = os.path.splitext(filename)[1].lower().lstrip('.')
-        
-        # Image extensions
-        if re.match(r'^(jpe?g|png|gif|svg|webp|bmp|tiff?|ico|heic|avif)$', extension):
-            return 'image'
-            
-        # Video extensions
-        if re.match(r'^(mp4|webm|mov|avi|wmv|flv|mkv|m4v|mpg|mpeg)$', extension):
-            return 'video'
-            
-        # Audio extensions
-        if re.match(r'^(mp3|wav|ogg|aac|flac|m4a|wma)$', extension):
-            return 'audio'
-            
-        # PDF
-        if extension == 'pdf':
-            return 'pdf'
-            
-        # 3D model extensions
-        if re.match(r'^(obj|stl|glb|gltf|fbx|3ds|dae|blend)$', extension):
-            return 'model'
-            
-        # Spreadsheet extensions
-        if re.match(r'^(xlsx?|csv|numbers|ods|gsheet)$', extension):
-            return 'spreadsheet'
-            
-        # Document extensions
-        if re.match(r'^(docx?|rtf|txt|md|pages|odt|pptx?|odp|key)$', extension):
-            return 'document'
-            
-        return 'unknown'
+        match = _EXTENSION_RE.search(filename)
+        if not match:
+            return 'unknown'
+        return _EXTENSION_TYPES.get(match.group(1).lower(), 'unknown')
     
     @staticmethod
     def is_image_type(type_str: str) -> bool:
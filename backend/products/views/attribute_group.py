@@ -38,6 +38,10 @@ class AttributeGroupViewSet(OrganizationQuerySetMixin, viewsets.ModelViewSet):
     queryset = AttributeGroup.objects.all()
     serializer_class = AttributeGroupSerializer
     permission_classes = [IsAuthenticated, IsStaffOrReadOnly]
+
+    def get_queryset(self):
+        """Organization-scoped groups with their items prefetched"""
+        return AttributeGroupSerializer.setup_eager_loading(super().get_queryset())
     
     def perform_create(self, serializer):
         """Set organization and created_by from request user"""
@@ -46,6 +50,10 @@ class AttributeGroupViewSet(OrganizationQuerySetMixin, viewsets.ModelViewSet):
             created_by=self.request.user
         )
         
+        # Groups created with their own items don't get the default attribute
+        if serializer.validated_data.get('attributegroupitem_set'):
+            return
+
         # Automatically add available attributes to the group
         try:
             # Get attributes for the same organization
@@ -259,6 +267,20 @@ class ProductAttributeGroupViewSet(OrganizationQuerySetMixin, viewsets.ReadOnlyM
     serializer_class = AttributeGroupSerializer
     permission_classes = [IsAuthenticated]
     
+    def _request_scope(self):
+        """Resolve the organization and locale PK once per request"""
+        if not hasattr(self, '_scope'):
+            org = get_user_organization(self.request.user)
+            locale_code = self.request.query_params.get('locale')
+            # Convert locale code to PK if provided
+            locale_pk = None
+            if locale_code:
+                locale_pk = Locale.objects.filter(
+                    organization=org, code=locale_code
+                ).values_list('pk', flat=True).first()
+            self._scope = (org, locale_pk)
+        return self._scope
+    
     def get_queryset(self):
         """Build a queryset of attribute groups for this product based on its family.
         
@@ -267,16 +289,8 @@ class ProductAttributeGroupViewSet(OrganizationQuerySetMixin, viewsets.ReadOnlyM
         2. Modified by any ProductFamilyOverride entries for the product
         """
         product_id = self.kwargs.get('product_pk')
-        locale_code = self.request.query_params.get('locale')
         channel_code = self.request.query_params.get('channel')
-        org = get_user_organization(self.request.user)
-
-        # Convert locale code to PK if provided
-        locale_pk = None
-        if locale_code:
-            locale_obj = Locale.objects.filter(organization=org, code=locale_code).first()
-            if locale_obj:
-                locale_pk = locale_obj.pk
+        org, locale_pk = self._request_scope()
 
         # Channel is a string, so use as-is
         channel = channel_code if channel_code else None
@@ -284,13 +298,17 @@ class ProductAttributeGroupViewSet(OrganizationQuerySetMixin, viewsets.ReadOnlyM
         if not product_id:
             return AttributeGroup.objects.none()
         try:
-            product = Product.objects.get(id=product_id, organization=org)
+            product = Product.objects.select_related('family').prefetch_related(
+                'family__attribute_groups', 'family_overrides'
+            ).get(id=product_id, organization=org)
             if not product.family:
                 return AttributeGroup.objects.none()
-            family_group_ids = product.family.attribute_groups.values_list('attribute_group_id', flat=True)
-            removed_group_ids = product.family_overrides.filter(removed=True).values_list('attribute_group_id', flat=True)
-            added_group_ids = product.family_overrides.filter(removed=False).values_list('attribute_group_id', flat=True)
-            effective_group_ids = (set(family_group_ids) - set(removed_group_ids)) | set(added_group_ids)
+            # Split the prefetched rows in Python rather than re-querying per filter
+            family_group_ids = {fag.attribute_group_id for fag in product.family.attribute_groups.all()}
+            overrides = product.family_overrides.all()
+            removed_group_ids = {o.attribute_group_id for o in overrides if o.removed}
+            added_group_ids = {o.attribute_group_id for o in overrides if not o.removed}
+            effective_group_ids = (family_group_ids - removed_group_ids) | added_group_ids
             if not effective_group_ids:
                 return AttributeGroup.objects.none()
             # Only use PKs for locale in the filter
@@ -306,7 +324,11 @@ class ProductAttributeGroupViewSet(OrganizationQuerySetMixin, viewsets.ReadOnlyM
                 id__in=effective_group_ids,
                 organization=org
             ).prefetch_related(
-                'attributegroupitem_set__attribute',
+                # Items and their attributes come back in one joined query
+                Prefetch(
+                    'attributegroupitem_set',
+                    queryset=AttributeGroupItem.objects.select_related('attribute')
+                ),
                 Prefetch(
                     'attributegroupitem_set__attribute__attributevalue_set',
                     queryset=AttributeValue.objects.filter(**value_filter).select_related('attribute'),
@@ -321,19 +343,13 @@ class ProductAttributeGroupViewSet(OrganizationQuerySetMixin, viewsets.ReadOnlyM
         serializer = self.get_serializer(queryset, many=True)
         data = serializer.data
         product_id = self.kwargs.get('product_pk')
-        locale_code = request.query_params.get('locale')
         channel = request.query_params.get('channel')
-        org = get_user_organization(request.user)
-        # Convert locale code to PK for all comparisons
-        locale_pk = None
-        if locale_code:
-            locale_obj = Locale.objects.filter(organization=org, code=locale_code).first()
-            if locale_obj:
-                locale_pk = locale_obj.pk
+        org, locale_pk = self._request_scope()
+        # The map keys render value.locale, so load it with the values
         all_attribute_values = AttributeValue.objects.filter(
             product_id=product_id,
             organization=org
-        )
+        ).select_related('locale')
         attribute_value_map = {}
         for value in all_attribute_values:
             key = f"{value.attribute_id}::{value.locale or ''}::{value.channel or ''}"
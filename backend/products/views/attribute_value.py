@@ -12,6 +12,9 @@ from products.permissions import IsStaffOrReadOnly
 from kernlogic.org_queryset import OrganizationQuerySetMixin
 from kernlogic.utils import get_user_organization
 from products.events import record
+import logging
+
+logger = logging.getLogger(__name__)
 
 @extend_schema_view(
     list=extend_schema(summary="List all attribute values", 
@@ -44,7 +47,11 @@ class AttributeValueViewSet(OrganizationQuerySetMixin, viewsets.ModelViewSet):
         org = get_user_organization(self.request.user)
 
         # Standard base queryset – always organisation scoped
-        qs = AttributeValue.objects.filter(organization=org).select_related('attribute', 'product')
+        qs = AttributeValue.objects.filter(organization=org)
+        if self.action in ('list', 'retrieve'):
+            qs = AttributeValueDetailSerializer.setup_eager_loading(qs)
+        else:
+            qs = qs.select_related('attribute', 'product')
 
         # Check if we are under a nested router with product_pk in kwargs
         product_pk = self.kwargs.get('product_pk') or self.kwargs.get('product_id')
@@ -70,9 +77,8 @@ class AttributeValueViewSet(OrganizationQuerySetMixin, viewsets.ModelViewSet):
         if locale_code is not None and locale_code != '':
             # Fix: Don't try to filter by locale code string directly
             # Instead, look up the locale by code or use NULL values
-            locale_qs = Locale.objects.filter(organization=org, code=locale_code)
-            if locale_qs.exists():
-                locale_obj = locale_qs.first()
+            locale_obj = Locale.objects.filter(organization=org, code=locale_code).first()
+            if locale_obj is not None:
                 qs = qs.filter(Q(locale=locale_obj) | Q(locale__isnull=True))
             else:
                 # If no matching locale found, only return values with null locale
@@ -130,9 +136,9 @@ class AttributeValueViewSet(OrganizationQuerySetMixin, viewsets.ModelViewSet):
         )
 
     @action(detail=False, methods=['post'])
-    def bulk_create(self, request):
+    def bulk_create(self, request, *args, **kwargs):
         """Create multiple attribute values at once"""
-        serializer = AttributeValueSerializer(data=request.data, many=True)
+        serializer = AttributeValueSerializer(data=request.data, many=True, context=self.get_serializer_context())
         if serializer.is_valid():
             serializer.save(organization=get_user_organization(request.user), created_by=request.user)
             return Response(serializer.data, status=status.HTTP_201_CREATED)
@@ -200,10 +206,10 @@ class ProductAttributeValueList(generics.ListAPIView):
             return AttributeValue.objects.none()
             
         # Return all attribute values for this product
-        return AttributeValue.objects.filter(
+        return AttributeValueDetailSerializer.setup_eager_loading(AttributeValue.objects.filter(
             product=product,
             organization=organization
-        ).select_related('attribute')
+        ))
 
 class AttributeValuesByAttributeList(generics.ListAPIView):
     """
@@ -293,22 +299,20 @@ class AttributeValuesByAttributeList(generics.ListAPIView):
 
     def create(self, request, *args, **kwargs):
         """Custom create method to set attribute in context"""
-        # Debug the raw request data
-        print(f"[DEBUG] Raw request data: {request.data}")
+        logger.debug("Raw request data: %r", request.data)
         
         # Get attribute ID from request data
         attribute_id = request.data.get('attribute')
         if not attribute_id:
             from rest_framework.exceptions import ValidationError
-            print(f"[DEBUG] ValidationError: attribute field is required")
+            logger.debug("ValidationError: attribute field is required")
             raise ValidationError({"attribute": "This field is required."})
             
         # Get product ID from URL
         product_id = self.kwargs.get('product_pk')
-        print(f"[DEBUG] Product ID from URL: {product_id}")
+        logger.debug("Product ID from URL: %s", product_id)
         
-        # Debug the attribute ID
-        print(f"[DEBUG] Attribute ID from request: {attribute_id}, type: {type(attribute_id)}")
+        logger.debug("Attribute ID from request: %r", attribute_id)
         
         try:
             # Get the attribute object
@@ -316,9 +320,9 @@ class AttributeValuesByAttributeList(generics.ListAPIView):
                 Attribute.objects.filter(organization=get_user_organization(request.user)),
                 pk=attribute_id
             )
-            print(f"[DEBUG] Found attribute: {attribute.id} - {attribute.label}")
+            logger.debug("Found attribute: %s - %s", attribute.id, attribute.label)
         except Exception as e:
-            print(f"[DEBUG] Error getting attribute: {str(e)}")
+            logger.debug("Error getting attribute: %s", e)
             raise
         
         # Get locale and channel from request data
@@ -331,7 +335,7 @@ class AttributeValuesByAttributeList(generics.ListAPIView):
         if channel == '':
             channel = None
         
-        print(f"[DEBUG] Locale: {locale}, Channel: {channel}")
+        logger.debug("Locale: %s, Channel: %s", locale, channel)
         
         # Check if an attribute value already exists for this combination
         try:
@@ -348,12 +352,12 @@ class AttributeValuesByAttributeList(generics.ListAPIView):
             if channel is not None:
                 filter_kwargs['channel'] = channel
                 
-            print(f"[DEBUG] Looking for existing attribute value with filters: {filter_kwargs}")
+            logger.debug("Looking for existing attribute value with filters: %s", filter_kwargs)
             
             # Try to find existing attribute value
             existing_value = AttributeValue.objects.get(**filter_kwargs)
             
-            print(f"[DEBUG] Found existing attribute value: {existing_value.id}")
+            logger.debug("Found existing attribute value: %s", existing_value.id)
             
             # If we get here, an attribute value exists - update it instead
             context = self.get_serializer_context()
@@ -398,27 +402,27 @@ class AttributeValuesByAttributeList(generics.ListAPIView):
             
         except AttributeValue.DoesNotExist:
             # No existing value found, create a new one
-            print("[DEBUG] No existing attribute value found, creating new one")
+            logger.debug("No existing attribute value found, creating new one")
             
             # Create a new context dictionary with the attribute
             context = self.get_serializer_context()
             context['attribute'] = attribute
             
             # Create serializer with updated context
-            print(f"[DEBUG] Creating serializer with attribute in context: {attribute.id}")
+            logger.debug("Creating serializer with attribute in context: %s", attribute.id)
             serializer = self.get_serializer(data=request.data, context=context)
             
             # Validate and check for errors
             try:
                 serializer.is_valid(raise_exception=True)
-                print(f"[DEBUG] Serializer valid with data: {serializer.validated_data}")
-                print(f"[DEBUG] Serializer initial_data: {serializer.initial_data}")
+                logger.debug("Serializer valid with data: %r", serializer.validated_data)
+                logger.debug("Serializer initial_data: %r", serializer.initial_data)
                 
                 # Check if attribute exists in validated data (it should be added in perform_create)
                 if 'attribute' not in serializer.validated_data:
-                    print(f"[DEBUG] WARNING: 'attribute' not in validated_data, we'll pass it explicitly")
+                    logger.debug("'attribute' not in validated_data, passing it explicitly")
             except Exception as e:
-                print(f"[DEBUG] Serializer validation error: {str(e)}")
+                logger.debug("Serializer validation error: %s", e)
                 raise
             
             # Get the product object
@@ -427,14 +431,14 @@ class AttributeValuesByAttributeList(generics.ListAPIView):
                 pk=product_id
             )
             
-            print(f"[DEBUG] About to save with attribute: {attribute.id}, product: {product.id}")
-            print(f"[DEBUG] Attribute data: label={attribute.label}, org={attribute.organization_id}")
-            print(f"[DEBUG] Product data: name={product.name}, org={product.organization_id}")
-            print(f"[DEBUG] Additional data: org={get_user_organization(request.user).id}, user={request.user.id}")
+            logger.debug(
+                "About to save attribute %s (org %s) on product %s (org %s) for user %s",
+                attribute.id, attribute.organization_id, product.id, product.organization_id, request.user.id,
+            )
             
             # Explicitly pass attribute to serializer.save()
             try:
-                print(f"[DEBUG] Explicitly passing attribute to serializer.save()")
+                logger.debug("Explicitly passing attribute to serializer.save()")
                 instance = serializer.save(
                     attribute=attribute,
                     product=product,
@@ -442,11 +446,11 @@ class AttributeValuesByAttributeList(generics.ListAPIView):
                     created_by=request.user,
                 )
                 
-                print(f"[DEBUG] Successfully created attribute value directly: {instance.id}")
+                logger.debug("Created attribute value %s", instance.id)
                 output = AttributeValueDetailSerializer(instance, context=self.get_serializer_context()).data
                 return Response(output, status=status.HTTP_201_CREATED)
             except Exception as e:
-                print(f"[DEBUG] Error creating attribute value directly: {str(e)}")
+                logger.debug("Error creating attribute value: %s", e)
                 raise
             
             # Original code - now unreachable
@@ -458,7 +462,7 @@ class AttributeValuesByAttributeList(generics.ListAPIView):
             # )
         except AttributeValue.MultipleObjectsReturned:
             # If multiple values exist, handle the duplication issue
-            print("[DEBUG] Multiple attribute values found, resolving duplication...")
+            logger.debug("Multiple attribute values found, resolving duplication")
             
             # Get all duplicate values
             duplicates = AttributeValue.objects.filter(**filter_kwargs).order_by('-id')
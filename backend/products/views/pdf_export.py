@@ -78,10 +78,11 @@ def generate_product_pdf(request, product_id):
         except:
             tags = []
         
-        # Calculate data completeness
+        # Data completeness from the denormalized cache columns; the two
+        # getters share one recomputation when the cache is stale
         try:
-            completeness_score = product.get_completeness()
-            missing_fields = product.get_missing_fields()
+            completeness_score = product.get_cached_completeness()
+            missing_fields = product.get_cached_missing_fields()
         except:
             completeness_score = 0
             missing_fields = []
@@ -5,7 +5,8 @@ from rest_framework import viewsets, status, filters
 from rest_framework.response import Response
 from rest_framework.decorators import action
 from rest_framework.exceptions import ValidationError, PermissionDenied
-from rest_framework.renderers import JSONRenderer
+from rest_framework.renderers import BrowsableAPIRenderer
+from kernlogic.renderers import ORJSONRenderer
 from kernlogic.org_queryset import OrganizationQuerySetMixin
 from kernlogic.utils import get_user_organization
 from .pagination import StandardResultsSetPagination
@@ -41,7 +42,7 @@ class CategoryViewSet(OrganizationQuerySetMixin, viewsets.ModelViewSet):
     search_fields = ['name']
     ordering_fields = ['name', 'tree_id', 'lft']
     ordering = ['tree_id', 'lft']
-    renderer_classes = [JSONRenderer]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
     http_method_names = ['get', 'post', 'patch', 'delete', 'head', 'options']
     permission_classes = [HasProductViewPermission]
 
@@ -131,12 +132,14 @@ class CategoryViewSet(OrganizationQuerySetMixin, viewsets.ModelViewSet):
             is_archived=False
         )
         
+        from .serializers import ProductSerializer
+        products = ProductSerializer.setup_eager_loading(products)
+        
         # Paginate the results using the product pagination
         from .views_main import ProductViewSet
         paginator = ProductViewSet.pagination_class()
         page = paginator.paginate_queryset(products, request)
         
-        from .serializers import ProductSerializer
         serializer = ProductSerializer(page, many=True, context={'request': request})
         
         return paginator.get_paginated_response(serializer.data)
@@ -1,7 +1,7 @@
 from django.shortcuts import render
 from django.http import HttpResponse, Http404
 from django.conf import settings
-from django.db.models import Sum, Count, F, Q, Subquery, OuterRef, Prefetch
+from django.db.models import Sum, Count, F, Q, Subquery, OuterRef, Prefetch, ExpressionWrapper, BooleanField
 from django.db.models.functions import Coalesce
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
@@ -19,7 +19,8 @@ from rest_framework.response import Response
 from rest_framework.decorators import action
 from rest_framework.exceptions import ValidationError, PermissionDenied
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
-from rest_framework.renderers import JSONRenderer
+from rest_framework.renderers import BrowsableAPIRenderer
+from kernlogic.renderers import ORJSONRenderer
 from rest_framework.generics import get_object_or_404
 
 from .models import (
@@ -33,7 +34,8 @@ from .serializers import (
     ProductAssetSerializer, ProductEventSerializer, AttributeValueSerializer,
     AttributeValueDetailSerializer, AttributeGroupSerializer, AttributeGroupItemSerializer,
     ProductPriceSerializer, SalesChannelSerializer, SimpleCategorySerializer, CategorySerializer,
-    AssetBundleSerializer, ProductListSerializer
+    AssetBundleSerializer, ProductListSerializer, FastProductListSerializer,
+    FAST_PRODUCT_LIST_VALUES
 )
 from django_filters.rest_framework import DjangoFilterBackend
 from .filters import ProductFilter
@@ -79,7 +81,6 @@ from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 from django.db import transaction, models
-from rest_framework.renderers import JSONRenderer
 from django.db.models import Sum, F, Q, Count
 from django.db.models.functions import Coalesce
 from decimal import Decimal
@@ -128,7 +129,7 @@ class ProductViewSet(OrganizationQuerySetMixin, viewsets.ModelViewSet):
     search_fields = ['name', 'sku', 'description', 'brand', 'tags', 'barcode']
     ordering_fields = ['name', 'created_at', 'brand']
     ordering = ['-created_at']
-    renderer_classes = [JSONRenderer]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
     parser_classes = [MultiPartParser, FormParser, JSONParser]
     http_method_names = ['get', 'post', 'patch', 'delete', 'head', 'options']
     queryset = Product.objects.all()  # Add base queryset for OrganizationQuerySetMixin to use
@@ -180,10 +181,17 @@ class ProductViewSet(OrganizationQuerySetMixin, viewsets.ModelViewSet):
         
         # For list view: Optimize by selecting only the needed fields
         if self.action == 'list':
+            # description can be large and the table never shows it, so only
+            # a flag for the completeness estimate is fetched
             qs = qs.only(
                 'id', 'name', 'sku', 'is_active', 'created_at', 'updated_at',
-                'category_id', 'description', 'brand', 'barcode', 'is_archived',
+                'category_id', 'brand', 'barcode', 'is_archived',
                 'family_id', 'tags'  # Include tags field directly
+            ).annotate(
+                has_description=ExpressionWrapper(
+                    Q(description__isnull=False) & ~Q(description=''),
+                    output_field=BooleanField()
+                )
             ).select_related('category', 'family')
             
             # Optimize price lookup by prefetching only necessary info
@@ -195,22 +203,19 @@ class ProductViewSet(OrganizationQuerySetMixin, viewsets.ModelViewSet):
                 ),
                 Prefetch(
                     'assets',
+                    # Primary asset first, falling back to the first image
                     queryset=ProductAsset.objects.filter(
-                        is_primary=True
-                    ).only('id', 'file', 'is_primary', 'asset_type')[:1],
+                        Q(is_primary=True) | Q(asset_type__icontains='image')
+                    ).only(
+                        'id', 'product_id', 'file', 'is_primary', 'asset_type'
+                    ).order_by('-is_primary', 'order')[:1],
                     to_attr='primary_assets'
                 )
                 # Removed 'tags' from prefetch_related since it's not a relation field
             )
-        else:
-            # For detail views: Prefetch all prices for efficient access
-            qs = qs.prefetch_related(
-                Prefetch(
-                    'prices',
-                    queryset=ProductPrice.objects.all(),
-                    to_attr='all_prices'
-                )
-            )
+        elif self.action in ('retrieve', 'update', 'partial_update'):
+            # For detail views: eager-load every relation ProductSerializer renders
+            qs = ProductSerializer.setup_eager_loading(qs)
             
         # Additional filters from query parameters
         category_id = self.request.query_params.get('category_id')
@@ -250,10 +255,41 @@ class ProductViewSet(OrganizationQuerySetMixin, viewsets.ModelViewSet):
         Override list method to use the lightweight ProductListSerializer
         for better performance when listing products.
         """
+        if request.query_params.get('fast', '').lower() in ('1', 'true'):
+            return self._fast_list(request)
+
         # Use the slim list serializer for better performance
         self.serializer_class = ProductListSerializer
         return super().list(request, *args, **kwargs)
 
+    def _fast_list(self, request):
+        """
+        Serve the list from ``.values()`` dicts via FastProductListSerializer,
+        skipping model instantiation and all related-manager lookups.
+        """
+        # Same pick as the regular list: primary asset first, falling back
+        # to the first image
+        primary_asset_file = ProductAsset.objects.filter(
+            Q(is_primary=True) | Q(asset_type__icontains='image'),
+            product=OuterRef('pk')
+        ).order_by('-is_primary', 'order').values('file')[:1]
+
+        queryset = (
+            self.filter_queryset(self.get_queryset())
+            .select_related(None)
+            .prefetch_related(None)
+            .annotate(primary_asset_file=Subquery(primary_asset_file))
+            .values(*FAST_PRODUCT_LIST_VALUES)
+        )
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = FastProductListSerializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
+        serializer = FastProductListSerializer(queryset, many=True)
+        return Response(serializer.data)
+
     def perform_create(self, serializer):
         """
         Set the created_by field and organization when creating a product.
@@ -272,37 +308,26 @@ class ProductViewSet(OrganizationQuerySetMixin, viewsets.ModelViewSet):
                 organization=organization
             )
                 
-            # Record product creation event
-            if product:
+            # The "created" ProductEvent and Activity rows are written by the
+            # product_saved signal
+            
+            # Check if primary_image exists and add it to assets collection
+            if product and hasattr(product, 'primary_image') and product.primary_image:
                 try:
-                    record(
+                    # Create an asset from the primary image
+                    from .models import ProductAsset
+                    asset = ProductAsset.objects.create(
                         product=product,
-                        user=self.request.user,
-                        event_type="created",
-                        summary=f"Product '{product.name}' was created",
-                        payload={"product_id": product.id, "sku": product.sku, "name": product.name}
+                        organization=organization,
+                        uploaded_by=self.request.user,
+                        asset_type='image',
+                        file=product.primary_image,
+                        name=f"{product.name} - Primary Image",
+                        is_primary=True
                     )
-                    
-                    # Check if primary_image exists and add it to assets collection
-                    if hasattr(product, 'primary_image') and product.primary_image:
-                        try:
-                            # Create an asset from the primary image
-                            from .models import ProductAsset
-                            asset = ProductAsset.objects.create(
-                                product=product,
-                                organization=organization,
-                                uploaded_by=self.request.user,
-                                asset_type='image',
-                                file=product.primary_image,
-                                name=f"{product.name} - Primary Image",
-                                is_primary=True
-                            )
-                            print(f"Created asset {asset.id} from product's primary image")
-                        except Exception as e:
-                            print(f"Error creating asset from primary image: {str(e)}")
-                    
+                    print(f"Created asset {asset.id} from product's primary image")
                 except Exception as e:
-                    print(f"Error recording product creation: {str(e)}")
+                    print(f"Error creating asset from primary image: {str(e)}")
         except Exception as e:
             print(f"Error in perform_create: {str(e)}")
             # Re-raise to let DRF handle the response
@@ -313,10 +338,12 @@ class ProductViewSet(OrganizationQuerySetMixin, viewsets.ModelViewSet):
 
         # 1) Snapshot old product fields
         old_product = self.get_object()
+        # Non-editable columns (timestamps, completeness caches) are internal
+        # bookkeeping, not product data, so they stay out of the history
         old_values = {
             f.name: serialize_field(getattr(old_product, f.name))
             for f in Product._meta.concrete_fields
-            if f.name not in ('id', 'created_at', 'updated_at')
+            if f.editable and f.name != 'id'
         }
         for key in ('tags', 'attributes'):
             old_values[key] = getattr(old_product, key)
@@ -566,14 +593,30 @@ class ProductViewSet(OrganizationQuerySetMixin, viewsets.ModelViewSet):
             
         created_products = []
         errors = []
+
+        # Check every submitted SKU against the (organization, sku) unique
+        # index in one query; validate_sku reads the set from the serializer context
+        submitted_skus = [
+            item['sku'] for item in products_data
+            if isinstance(item, dict) and isinstance(item.get('sku'), str)
+        ]
+        existing_skus = set(
+            Product.objects.filter(
+                organization=organization,
+                sku__in=submitted_skus
+            ).values_list('sku', flat=True)
+        )
+        self._get_serializer_caches()['_existing_skus'] = existing_skus
         
         for index, product_data in enumerate(products_data):
             serializer = self.get_serializer(data=product_data)
             if serializer.is_valid():
-                serializer.save(
+                product = serializer.save(
                     created_by=request.user,
                     organization=organization
                 )
+                # Later rows in the same payload must not reuse this SKU
+                existing_skus.add(product.sku)
                 created_products.append(serializer.data)
             else:
                 errors.append({
@@ -779,8 +822,9 @@ class ProductViewSet(OrganizationQuerySetMixin, viewsets.ModelViewSet):
                     status=status.HTTP_400_BAD_REQUEST
                 )
                 
-            # Perform the update
-            update_data = {field: value}
+            # Perform the update; queryset updates skip signals, so mark
+            # the completeness cache stale explicitly
+            update_data = {field: value, 'completeness_cache': None, 'missing_fields_cache': None}
             updated_count = products.update(**update_data)
             
             # Record a bulk update event for each product
@@ -819,12 +863,22 @@ class ProductViewSet(OrganizationQuerySetMixin, viewsets.ModelViewSet):
         print("Validation errors:", serializer.errors)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+    def _get_serializer_caches(self):
+        """
+        Per-request caches shared by every serializer built for this request:
+        serialized category ancestor chains and resolved related-field pks.
+        """
+        if not hasattr(self, '_serializer_caches'):
+            self._serializer_caches = {'_cat_repr_cache': {}, '_pk_cache': {}}
+        return self._serializer_caches
+
     def get_serializer_context(self):
         """
         Extra context provided to the serializer class.
         """
         context = super().get_serializer_context()
         context['request'] = self.request
+        context.update(self._get_serializer_caches())
         return context
 
     @action(detail=False, methods=['post'])
@@ -937,16 +991,20 @@ class ProductViewSet(OrganizationQuerySetMixin, viewsets.ModelViewSet):
         # Get the current product
         product = self.get_object()
         
-        # Get explicitly related products from the ProductRelation model
-        relation_queryset = ProductRelation.objects.filter(
+        # Get explicitly related products from the ProductRelation model,
+        # eager-loaded for ProductSerializer and kept in relation order
+        explicit_related_product_ids = list(ProductRelation.objects.filter(
             product=product
-        ).select_related('related_product')
-        
-        explicit_related_products = [relation.related_product for relation in relation_queryset]
-        explicit_related_product_ids = [p.id for p in explicit_related_products]
+        ).values_list('related_product_id', flat=True))
+        related_by_id = ProductSerializer.setup_eager_loading(
+            Product.objects.filter(pk__in=explicit_related_product_ids)
+        ).in_bulk()
+        explicit_related_products = [
+            related_by_id[pk] for pk in explicit_related_product_ids if pk in related_by_id
+        ]
         
         # Base queryset excluding current product and already explicitly related products
-        base_queryset = self.get_queryset().exclude(
+        base_queryset = ProductSerializer.setup_eager_loading(self.get_queryset()).exclude(
             pk__in=[product.pk] + explicit_related_product_ids
         )
         
@@ -1858,19 +1916,19 @@ class DashboardViewSet(viewsets.ViewSet):
             try:
                 organization = get_user_organization(request.user)
                 if organization:
-                    activities = Activity.objects.filter(
+                    activities = Activity.objects.select_related('user').filter(
                         organization=organization
                     ).order_by('-created_at')[:10]
                 else:
                     # Fallback to user filter if no organization
                     print(f"WARNING: No organization found for user {request.user}. Falling back to user filter.")
-                    activities = Activity.objects.filter(
+                    activities = Activity.objects.select_related('user').filter(
                         user=request.user
                     ).order_by('-created_at')[:10]
             except Exception as e:
                 print(f"Exception in activity organization lookup: {str(e)}")
                 # Fallback to user filter
-                activities = Activity.objects.filter(
+                activities = Activity.objects.select_related('user').filter(
                     user=request.user
                 ).order_by('-created_at')[:10]
             
@@ -1917,48 +1975,51 @@ class DashboardViewSet(viewsets.ViewSet):
                 print(f"ERROR: Failed to get attributes: {str(e)}")
                 all_attributes = {}
             
-            # Calculate completeness for each product
-            products_with_completeness = []
-            for product in queryset:
+            # Refresh any stale denormalized completeness rows, then let the
+            # database pick the five least complete products from the cache
+            # columns instead of recomputing completeness for every product
+            for product in queryset.filter(completeness_cache__isnull=True):
                 try:
-                    completeness = product.get_completeness()
-                    if completeness < 100:  # Only include incomplete products
-                        try:
-                            missing_fields = product.get_missing_fields()
-                            
-                            # Add attribute details to missing fields
-                            for field in missing_fields:
-                                if 'attribute_id' in field and field['attribute_id'] in all_attributes:
-                                    attr = all_attributes[field['attribute_id']]
-                                    field['attribute_code'] = attr.code
-                                    field['attribute_type'] = attr.data_type
-                            
-                            field_completeness = product.get_field_completeness()
-                            products_with_completeness.append({
-                                'product': product,
-                                'completeness': completeness,
-                                'missing_fields': missing_fields,
-                                'field_completeness': field_completeness
-                            })
-                        except json.JSONDecodeError:
-                            print(f"WARNING: JSON decode error for product {product.id} during missing fields calculation")
-                            # Add product with minimal data
-                            products_with_completeness.append({
-                                'product': product,
-                                'completeness': completeness,
-                                'missing_fields': [{'field': 'Invalid data format', 'weight': 1}],
-                                'field_completeness': []
-                            })
-                        except Exception as e:
-                            print(f"ERROR: Failed to get field data for product {product.id}: {str(e)}")
-                except json.JSONDecodeError:
-                    print(f"WARNING: JSON decode error for product {product.id} during completeness calculation")
+                    product.refresh_completeness_cache()
                 except Exception as e:
                     print(f"ERROR: Failed to calculate completeness for product {product.id}: {str(e)}")
             
-            # Sort by completeness (ascending) and take top 5
-            products_with_completeness.sort(key=lambda x: x['completeness'])
-            incomplete_products = products_with_completeness[:5]
+            incomplete_queryset = queryset.filter(
+                completeness_cache__lt=100
+            ).order_by('completeness_cache', '-created_at')[:5]
+            
+            # Only the returned products need the detailed field breakdown
+            incomplete_products = []
+            for product in incomplete_queryset:
+                completeness = product.completeness_cache
+                try:
+                    missing_fields = product.get_cached_missing_fields()
+                    
+                    # Add attribute details to missing fields
+                    for field in missing_fields:
+                        if 'attribute_id' in field and field['attribute_id'] in all_attributes:
+                            attr = all_attributes[field['attribute_id']]
+                            field['attribute_code'] = attr.code
+                            field['attribute_type'] = attr.data_type
+                    
+                    field_completeness = product.get_field_completeness()
+                    incomplete_products.append({
+                        'product': product,
+                        'completeness': completeness,
+                        'missing_fields': missing_fields,
+                        'field_completeness': field_completeness
+                    })
+                except json.JSONDecodeError:
+                    print(f"WARNING: JSON decode error for product {product.id} during missing fields calculation")
+                    # Add product with minimal data
+                    incomplete_products.append({
+                        'product': product,
+                        'completeness': completeness,
+                        'missing_fields': [{'field': 'Invalid data format', 'weight': 1}],
+                        'field_completeness': []
+                    })
+                except Exception as e:
+                    print(f"ERROR: Failed to get field data for product {product.id}: {str(e)}")
             
             # Prepare serializer data
             serializer_data = []
@@ -1,4 +1,5 @@
 from rest_framework import mixins, viewsets, response
+from django.db.models import F
 from django.shortcuts import get_object_or_404
 from .models import Product, Activity, ProductEvent
 from .serializers_readonly import (
@@ -29,7 +30,10 @@ class ActivityViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
         # Filter activities related to this product
         # We're using the Activity model which is close enough
         product_id = self.kwargs["product_pk"]
-        return Activity.objects.filter(entity='product', entity_id=product_id)
+        # Read the username through the join instead of loading each user row
+        return Activity.objects.filter(entity='product', entity_id=product_id).annotate(
+            user_username=F('user__username')
+        ).only('id', 'action', 'created_at', 'message')
 
 class AttributeSetViewSet(mixins.RetrieveModelMixin, viewsets.GenericViewSet):
     # For attribute sets, we'll need to handle this manually
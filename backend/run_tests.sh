@@ -13,7 +13,8 @@ python manage.py makemigrations --check --dry-run
 # Specifically include the attribute isolation test to ensure it's part of the CI process
 pytest products/tests/test_attributes.py::AttributeTests::test_attribute_isolation
 
-# Run all tests
-pytest
+# Run all tests, spread over all cores with pytest-xdist. loadscope keeps a
+# TestCase class (and its setUpTestData) on one worker.
+pytest -n auto --dist=loadscope
 
 echo "All tests passed!" 
\ No newline at end of file